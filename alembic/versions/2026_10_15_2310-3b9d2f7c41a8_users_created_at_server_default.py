@@ -0,0 +1,32 @@
+"""users_created_at_server_default
+
+Revision ID: 3b9d2f7c41a8
+Revises: efca27a304b5
+Create Date: 2026-10-15 23:10:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2f7c41a8'
+down_revision: Union[str, None] = 'efca27a304b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('users', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('users', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=None,
+               existing_nullable=False)
@@ -0,0 +1,53 @@
+"""classifications_active_listing_indexes
+
+Revision ID: 8e41c0d5a7f2
+Revises: 3b9d2f7c41a8
+Create Date: 2026-10-15 23:25:40.107211
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41c0d5a7f2'
+down_revision: Union[str, None] = '3b9d2f7c41a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_classifications_user_active_created',
+            'classifications',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_classifications_user_grain_active_created',
+            'classifications',
+            ['user_id', 'grain_type', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_classifications_user_grain_active_created',
+            table_name='classifications',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_classifications_user_active_created',
+            table_name='classifications',
+            postgresql_concurrently=True,
+        )
@@ -2,7 +2,9 @@
 Schemas Pydantic para autenticação.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.application.schemas.user import FastEmail, UserResponse
 
 
 class LoginRequest(BaseModel):
@@ -14,7 +16,7 @@ class LoginRequest(BaseModel):
         password: Senha em texto plano
     """
 
-    email: EmailStr = Field(
+    email: FastEmail = Field(
         ...,
         description="Email do usuário",
         examples=["usuario@example.com"],
@@ -24,18 +26,10 @@ class LoginRequest(BaseModel):
         ...,
         min_length=1,
         description="Senha do usuário",
+        examples=["MinhasenhaSegura123!"],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "email": "usuario@example.com",
-                    "password": "MinhasenhaSegura123!",
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(defer_build=True)
 
 
 class TokenResponse(BaseModel):
@@ -48,8 +42,10 @@ class TokenResponse(BaseModel):
     token_type: str = Field(default="bearer", description="Tipo do token")
     expires_in: int = Field(..., description="Tempo de expiração em segundos")
 
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "examples": [
                 {
                     "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -58,8 +54,8 @@ class TokenResponse(BaseModel):
                     "expires_in": 900,
                 }
             ]
-        }
-    }
+        },
+    )
 
 
 class LoginResponse(BaseModel):
@@ -67,7 +63,7 @@ class LoginResponse(BaseModel):
     Schema para resposta de login bem-sucedido.
     """
 
-    user: dict = Field(..., description="Dados do usuário")
+    user: UserResponse = Field(..., description="Dados do usuário")
     tokens: TokenResponse = Field(..., description="Tokens de autenticação")
 
     model_config = {
@@ -78,6 +74,11 @@ class LoginResponse(BaseModel):
                         "id": 1,
                         "email": "usuario@example.com",
                         "name": "João Silva",
+                        "phone": "11987654321",
+                        "is_active": True,
+                        "is_verified": False,
+                        "created_at": "2025-10-23T10:00:00Z",
+                        "last_login": "2025-10-23T15:30:00Z",
                     },
                     "tokens": {
                         "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -100,17 +101,10 @@ class RefreshTokenRequest(BaseModel):
         ...,
         min_length=1,
         description="Refresh token",
+        examples=["eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(defer_build=True)
 
 
 class LogoutRequest(BaseModel):
@@ -121,17 +115,10 @@ class LogoutRequest(BaseModel):
     refresh_token: str | None = Field(
         default=None,
         description="Refresh token a ser revogado",
+        examples=["eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(defer_build=True)
 
 
 class MessageResponse(BaseModel):
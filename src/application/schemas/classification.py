@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ClassificationResponse(BaseModel):
@@ -21,7 +21,11 @@ class ClassificationResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
+
+
+CLASSIFICATION_ADAPTER = TypeAdapter(ClassificationResponse)
+CLASSIFICATION_LIST_ADAPTER = TypeAdapter(list[ClassificationResponse])
 
 
 class ClassificationUpdate(BaseModel):
@@ -37,3 +41,39 @@ class ClassificationListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+
+
+class ClassificationBulkError(BaseModel):
+    """Falha de um arquivo no envio em lote."""
+
+    filename: str | None
+    detail: str
+
+
+class ClassificationBulkResponse(BaseModel):
+    """Resultado do envio em lote de classificações."""
+
+    items: list[ClassificationResponse]
+    errors: list[ClassificationBulkError]
+
+
+class ClassificationImportItem(BaseModel):
+    """Registro de classificação para importação em massa."""
+
+    user_id: int
+    image_path: str = Field(..., max_length=500)
+    grain_type: str = Field(..., max_length=100)
+    confidence_score: Decimal | None = None
+    extra_data: dict | None = None
+
+
+class ClassificationImportRequest(BaseModel):
+    """Lote de classificações a importar."""
+
+    items: list[ClassificationImportItem] = Field(..., min_length=1, max_length=50_000)
+
+
+class ClassificationImportResponse(BaseModel):
+    """Resultado da importação em massa."""
+
+    imported: int
@@ -3,20 +3,35 @@ Schemas Pydantic para usuários.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
 import re
 
+from src.config.security.password import validate_password_strength
+from src.domain.entities.user import UserEntity
 from src.config.settings import settings
 
+_NAME_RE = re.compile(r"^[a-zA-ZÀ-ÿ\s]+$")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _fast_email_check(v: str) -> str:
+    """Valida o formato básico do email sem depender do email-validator."""
+    if "@" not in v or not _EMAIL_RE.match(v):
+        raise ValueError("Email inválido")
+    return v
+
+
+FastEmail = Annotated[str, AfterValidator(_fast_email_check)]
+
 
 class UserBase(BaseModel):
     """
     Schema base para usuário com campos comuns.
     """
 
-    email: EmailStr = Field(
+    email: FastEmail = Field(
         ...,
         description="Email do usuário",
         examples=["usuario@example.com"],
@@ -52,33 +67,15 @@ class UserCreate(UserBase):
         description="Senha do usuário",
     )
 
-    password_confirm: str = Field(
-        ...,
-        min_length=settings.PASSWORD_MIN_LENGTH,
-        max_length=128,
-        description="Confirmação da senha",
-    )
-
     @field_validator("password")
     @classmethod
     def validate_password_strength(cls, v: str) -> str:
         """Valida força da senha usando configurações do settings."""
-        from src.config.security.password import validate_password_strength
-
         is_valid, error_message = validate_password_strength(v)
         if not is_valid:
             raise ValueError(error_message)
         return v
 
-    @field_validator("password_confirm")
-    @classmethod
-    def validate_password_match(cls, v: str, info) -> str:
-        """Valida se a confirmação de senha corresponde à senha."""
-        password = info.data.get("password")
-        if password and v != password:
-            raise ValueError("As senhas não correspondem")
-        return v
-
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
@@ -89,22 +86,11 @@ class UserCreate(UserBase):
         if len(v.strip()) < 2:
             raise ValueError("Nome deve ter no mínimo 2 caracteres")
 
-        if not re.match(r"^[a-zA-ZÀ-ÿ\s]+$", v):
+        if not _NAME_RE.match(v):
             raise ValueError("Nome deve conter apenas letras e espaços")
 
         return v.strip()
 
-    @field_validator("phone")
-    @classmethod
-    def validate_phone(cls, v: str) -> str:
-        """Valida o telefone do usuário (apenas dígitos)."""
-        phone_digits = re.sub(r'\D', '', v)
-
-        if len(phone_digits) < 10 or len(phone_digits) > 11:
-            raise ValueError("Telefone deve ter 10 ou 11 dígitos")
-
-        return phone_digits
-
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -113,7 +99,6 @@ class UserCreate(UserBase):
                     "name": "João Silva",
                     "phone": "11987654321",
                     "password": "MinhasenhaSegura123!",
-                    "password_confirm": "MinhasenhaSegura123!",
                 }
             ]
         }
@@ -130,11 +115,13 @@ class UserUpdate(BaseModel):
         min_length=2,
         max_length=100,
         description="Nome completo do usuário",
+        examples=["João Silva Santos"],
     )
 
-    email: Optional[EmailStr] = Field(
+    email: Optional[FastEmail] = Field(
         default=None,
         description="Email do usuário",
+        examples=["joao.santos@example.com"],
     )
 
     phone: Optional[str] = Field(
@@ -142,6 +129,7 @@ class UserUpdate(BaseModel):
         min_length=10,
         max_length=11,
         description="Telefone do usuário (apenas dígitos)",
+        examples=["11987654321"],
         pattern=r"^\d{10,11}$",
     )
 
@@ -159,8 +147,6 @@ class UserUpdate(BaseModel):
         if v is None:
             return v
 
-        from src.config.security.password import validate_password_strength
-
         is_valid, error_message = validate_password_strength(v)
         if not is_valid:
             raise ValueError(error_message)
@@ -179,36 +165,12 @@ class UserUpdate(BaseModel):
         if len(v.strip()) < 2:
             raise ValueError("Nome deve ter no mínimo 2 caracteres")
 
-        if not re.match(r"^[a-zA-ZÀ-ÿ\s]+$", v):
+        if not _NAME_RE.match(v):
             raise ValueError("Nome deve conter apenas letras e espaços")
 
         return v.strip()
 
-    @field_validator("phone")
-    @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
-        """Valida o telefone se fornecido."""
-        if v is None:
-            return v
-
-        phone_digits = re.sub(r'\D', '', v)
-
-        if len(phone_digits) < 10 or len(phone_digits) > 11:
-            raise ValueError("Telefone deve ter 10 ou 11 dígitos")
-
-        return phone_digits
-
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "João Silva Santos",
-                    "email": "joao.santos@example.com",
-                    "phone": "11987654321",
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(defer_build=True)
 
 
 class UserResponse(UserBase):
@@ -222,9 +184,11 @@ class UserResponse(UserBase):
     created_at: datetime = Field(..., description="Data de criação da conta")
     last_login: Optional[datetime] = Field(None, description="Data do último login")
 
-    model_config = {
-        "from_attributes": True,
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "examples": [
                 {
                     "id": 1,
@@ -237,8 +201,24 @@ class UserResponse(UserBase):
                     "last_login": "2025-10-23T15:30:00Z",
                 }
             ]
-        }
-    }
+        },
+    )
+
+    @classmethod
+    def from_entity(cls, user: UserEntity) -> "UserResponse":
+        """
+        Monta a resposta a partir de uma entidade já validada, sem revalidar.
+        """
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            phone=user.phone,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            created_at=user.created_at,
+            last_login=user.last_login,
+        )
 
 
 class UserInDB(UserResponse):
@@ -248,9 +228,7 @@ class UserInDB(UserResponse):
 
     hashed_password: str = Field(..., description="Senha hasheada")
 
-    model_config = {
-        "from_attributes": True,
-    }
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
 
 
 class UserListResponse(BaseModel):
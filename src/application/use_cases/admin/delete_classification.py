@@ -1,8 +1,11 @@
 """Use case admin para deletar classificação."""
 
+import asyncio
+
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
 from src.infrastructure.repositories.audit_log_repository_impl import AuditLogRepositoryImpl
 from src.infrastructure.services.storage_service import StorageService
+from src.config.exceptions.custom_exceptions import NotFoundError
 from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,11 +17,12 @@ class DeleteClassificationAdminUseCase:
     def __init__(
         self,
         classification_repo: ClassificationRepositoryImpl,
-        audit_repo: AuditLogRepositoryImpl
+        audit_repo: AuditLogRepositoryImpl,
+        storage: StorageService
     ):
         self.classification_repo = classification_repo
         self.audit_repo = audit_repo
-        self.storage = StorageService()
+        self.storage = storage
 
     async def execute(
         self,
@@ -33,24 +37,24 @@ class DeleteClassificationAdminUseCase:
         )
 
         if not classification:
-            from src.config.exceptions.custom_exceptions import NotFoundError
             raise NotFoundError("Classificação não encontrada")
 
         if hard_delete:
-            await self.audit_repo.create(
-                user_id=admin_user_id,
-                action="hard_delete_classification",
-                resource_type="classifications",
-                resource_id=classification_id,
-                changes={
-                    "grain_type": classification.grain_type,
-                    "user_id": classification.user_id,
-                    "image_path": classification.image_path
-                }
+            await asyncio.gather(
+                self.audit_repo.create(
+                    user_id=admin_user_id,
+                    action="hard_delete_classification",
+                    resource_type="classifications",
+                    resource_id=classification_id,
+                    changes={
+                        "grain_type": classification.grain_type,
+                        "user_id": classification.user_id,
+                        "image_path": classification.image_path
+                    }
+                ),
+                asyncio.to_thread(self.storage.delete_image, classification.image_path),
             )
 
-            self.storage.delete_image(classification.image_path)
-
             result = await self.classification_repo.hard_delete(classification_id)
 
             logger.info(
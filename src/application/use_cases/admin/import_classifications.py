@@ -0,0 +1,48 @@
+"""Use case admin para importação em massa de classificações."""
+
+from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
+from src.infrastructure.repositories.audit_log_repository_impl import AuditLogRepositoryImpl
+from src.application.schemas.classification import (
+    ClassificationImportItem,
+    ClassificationImportResponse
+)
+from src.config.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ImportClassificationsUseCase:
+    """Importa classificações já processadas (backfills e migrações)."""
+
+    def __init__(
+        self,
+        classification_repo: ClassificationRepositoryImpl,
+        audit_repo: AuditLogRepositoryImpl
+    ):
+        self.classification_repo = classification_repo
+        self.audit_repo = audit_repo
+
+    async def execute(
+        self,
+        items: list[ClassificationImportItem],
+        admin_user_id: int
+    ) -> ClassificationImportResponse:
+        """Insere o lote e registra auditoria."""
+        imported = await self.classification_repo.create_bulk(
+            [item.model_dump() for item in items]
+        )
+
+        await self.audit_repo.create(
+            user_id=admin_user_id,
+            action="import_classifications",
+            resource_type="classifications",
+            changes={"imported": imported}
+        )
+
+        logger.info(
+            "Classifications imported",
+            imported=imported,
+            admin_user_id=admin_user_id
+        )
+
+        return ClassificationImportResponse(imported=imported)
@@ -1,7 +1,10 @@
 """Use case admin para listar todas classificações."""
 
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
-from src.application.schemas.classification import ClassificationListResponse, ClassificationResponse
+from src.application.schemas.classification import (
+    CLASSIFICATION_LIST_ADAPTER,
+    ClassificationListResponse,
+)
 
 
 class ListAllClassificationsUseCase:
@@ -19,7 +22,7 @@ class ListAllClassificationsUseCase:
         include_deleted: bool = False
     ) -> ClassificationListResponse:
         """Lista todas classificações com filtros."""
-        classifications = await self.classification_repo.list_all(
+        classifications, total = await self.classification_repo.list_with_total(
             user_id=user_id,
             skip=skip,
             limit=limit,
@@ -27,13 +30,7 @@ class ListAllClassificationsUseCase:
             grain_type=grain_type
         )
 
-        total = await self.classification_repo.count(
-            user_id=user_id,
-            include_deleted=include_deleted,
-            grain_type=grain_type
-        )
-
-        items = [ClassificationResponse.model_validate(c) for c in classifications]
+        items = CLASSIFICATION_LIST_ADAPTER.validate_python(classifications, from_attributes=True)
 
         return ClassificationListResponse(
             items=items,
@@ -2,7 +2,7 @@
 
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
 from src.infrastructure.repositories.audit_log_repository_impl import AuditLogRepositoryImpl
-from src.application.schemas.classification import ClassificationResponse
+from src.application.schemas.classification import CLASSIFICATION_ADAPTER, ClassificationResponse
 from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,7 +25,7 @@ class RestoreClassificationUseCase:
         admin_user_id: int
     ) -> ClassificationResponse:
         """Restaura classificação deletada."""
-        await self.classification_repo.restore(classification_id)
+        classification = await self.classification_repo.restore(classification_id)
 
         await self.audit_repo.create(
             user_id=admin_user_id,
@@ -34,15 +34,10 @@ class RestoreClassificationUseCase:
             resource_id=classification_id
         )
 
-        classification = await self.classification_repo.get_by_id(
-            classification_id=classification_id,
-            include_deleted=False
-        )
-
         logger.info(
             "Classification restored",
             classification_id=classification_id,
             admin_user_id=admin_user_id
         )
 
-        return ClassificationResponse.model_validate(classification)
+        return CLASSIFICATION_ADAPTER.validate_python(classification, from_attributes=True)
@@ -9,10 +9,11 @@ from src.domain.repositories.user_repository import UserRepository
 from src.domain.repositories.refresh_token_repository import RefreshTokenRepository
 from src.application.schemas.auth import LoginRequest, LoginResponse, TokenResponse
 from src.application.schemas.user import UserResponse
-from src.config.security.password import verify_password
+from src.config.security.password import verify_password_async
 from src.config.security.auth import create_access_token, create_refresh_token
 from src.config.exceptions.custom_exceptions import AuthenticationError
 from src.config.settings import settings
+from src.application.use_cases.users.get_user import invalidate_user_cache
 from src.config.logging.logger import get_logger, log_auth_event
 
 logger = get_logger(__name__)
@@ -46,7 +47,6 @@ class LoginUserUseCase:
 
         if not user:
             log_auth_event(
-                logger,
                 event_type="login",
                 email=login_data.email,
                 success=False,
@@ -58,9 +58,8 @@ class LoginUserUseCase:
                 details={"email": login_data.email},
             )
 
-        if not verify_password(login_data.password, user.hashed_password):
+        if not await verify_password_async(login_data.password, user.hashed_password):
             log_auth_event(
-                logger,
                 event_type="login",
                 user_id=user.id,
                 email=user.email,
@@ -75,7 +74,6 @@ class LoginUserUseCase:
 
         if not user.is_active:
             log_auth_event(
-                logger,
                 event_type="login",
                 user_id=user.id,
                 email=user.email,
@@ -88,11 +86,13 @@ class LoginUserUseCase:
                 details={"user_id": user.id},
             )
 
+        now = datetime.now(timezone.utc)
+
         access_token = create_access_token(subject=user.id)
 
         refresh_token = create_refresh_token(subject=user.id)
 
-        expires_at = datetime.now(timezone.utc) + timedelta(
+        expires_at = now + timedelta(
             days=settings.REFRESH_TOKEN_EXPIRE_DAYS
         )
 
@@ -106,11 +106,11 @@ class LoginUserUseCase:
 
         await self.user_repository.update_last_login(
             user_id=user.id,
-            login_time=datetime.now(timezone.utc),
+            login_time=now,
         )
+        invalidate_user_cache(user.id)
 
         log_auth_event(
-            logger,
             event_type="login",
             user_id=user.id,
             email=user.email,
@@ -118,15 +118,15 @@ class LoginUserUseCase:
             ip=ip_address,
         )
 
-        user_response = UserResponse(
+        user_response = UserResponse.model_construct(
             id=user.id,
             email=user.email,
             name=user.name,
             phone=user.phone,
             is_active=user.is_active,
             is_verified=user.is_verified,
-            created_at=user.created_at or datetime.now(timezone.utc),
-            last_login=datetime.now(timezone.utc),
+            created_at=user.created_at,
+            last_login=now,
         )
 
         tokens = TokenResponse(
@@ -137,6 +137,6 @@ class LoginUserUseCase:
         )
 
         return LoginResponse(
-            user=user_response.model_dump(),
+            user=user_response,
             tokens=tokens,
         )
@@ -38,7 +38,6 @@ class LogoutUserUseCase:
             )
 
             log_auth_event(
-                logger,
                 event_type="logout_all",
                 user_id=user_id,
                 success=True,
@@ -55,7 +54,6 @@ class LogoutUserUseCase:
                 tokens_revoked = 1
 
                 log_auth_event(
-                    logger,
                     event_type="logout",
                     user_id=user_id,
                     success=True,
@@ -75,7 +73,6 @@ class LogoutUserUseCase:
 
         else:
             log_auth_event(
-                logger,
                 event_type="logout",
                 user_id=user_id,
                 success=True,
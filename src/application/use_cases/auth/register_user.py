@@ -1,13 +1,12 @@
 """Use Case para registro de novos usuários."""
 
-from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.entities.user import UserEntity
 from src.application.schemas.user import UserCreate, UserResponse
-from src.config.security.password import get_password_hash
-from src.config.exceptions.custom_exceptions import ConflictError, DatabaseError
+from src.config.security.password import hash_password_async
+from src.config.exceptions.custom_exceptions import DatabaseError
 from src.config.logging.logger import get_logger
 from src.infrastructure.repositories.role_repository_impl import RoleRepositoryImpl
 
@@ -27,15 +26,7 @@ class RegisterUserUseCase:
         """
         logger.info("Starting user registration", email=user_data.email)
 
-        existing_user = await self.user_repository.exists_by_email(user_data.email)
-        if existing_user:
-            logger.warning("Registration failed - email already exists", email=user_data.email)
-            raise ConflictError(
-                f"Email '{user_data.email}' já está cadastrado",
-                details={"email": user_data.email},
-            )
-
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
 
         user_entity = UserEntity(
             email=user_data.email,
@@ -46,17 +37,18 @@ class RegisterUserUseCase:
             is_verified=False,
         )
 
+        # Email duplicado é detectado pelo próprio INSERT (ConflictError)
         created_user = await self.user_repository.create(user_entity)
         role_repo = RoleRepositoryImpl(self.db)
-        classificador_role = await role_repo.get_by_name("classificador")
+        classificador_role_id = await role_repo.get_id_by_name("classificador")
 
-        if not classificador_role:
+        if classificador_role_id is None:
             logger.error("Role 'classificador' not found in database")
             raise DatabaseError("Erro de configuração: role 'classificador' não encontrada")
 
         await role_repo.assign_role_to_user(
             user_id=created_user.id,
-            role_id=classificador_role.id,
+            role_id=classificador_role_id,
             assigned_by=None
         )
 
@@ -67,13 +59,4 @@ class RegisterUserUseCase:
             role="classificador"
         )
 
-        return UserResponse(
-            id=created_user.id,
-            email=created_user.email,
-            name=created_user.name,
-            phone=created_user.phone,
-            is_active=created_user.is_active,
-            is_verified=created_user.is_verified,
-            created_at=created_user.created_at or datetime.now(timezone.utc),
-            last_login=created_user.last_login,
-        )
+        return UserResponse.from_entity(created_user)
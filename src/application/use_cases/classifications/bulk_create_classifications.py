@@ -0,0 +1,104 @@
+"""Use case para criar várias classificações em um único envio."""
+
+import asyncio
+from collections.abc import Iterable
+
+from fastapi import HTTPException, UploadFile
+
+from src.application.use_cases.classifications.create_classification import CreateClassificationUseCase
+from src.application.schemas.classification import (
+    ClassificationBulkError,
+    ClassificationBulkResponse,
+)
+from src.config.exceptions.custom_exceptions import DemeterException, FileUploadError
+from src.config.logging.logger import get_logger
+from src.config.settings import settings
+
+logger = get_logger(__name__)
+
+
+class BulkCreateClassificationsUseCase:
+    """Classifica várias imagens concorrentemente, limitado por semáforo."""
+
+    def __init__(self, create_use_case: CreateClassificationUseCase):
+        self.create_use_case = create_use_case
+
+    async def execute(
+        self,
+        user_id: int,
+        images: list[UploadFile],
+        notes: str | None = None
+    ) -> ClassificationBulkResponse:
+        """Classifica as imagens e grava as que tiveram sucesso."""
+        if len(images) > settings.MAX_BULK_CLASSIFY_FILES:
+            raise FileUploadError(
+                f"Máximo de {settings.MAX_BULK_CLASSIFY_FILES} imagens por envio",
+                details={
+                    "max_files": settings.MAX_BULK_CLASSIFY_FILES,
+                    "received": len(images),
+                },
+            )
+
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_CLASSIFIES)
+
+        async def analyze(image: UploadFile) -> tuple[str, dict]:
+            async with semaphore:
+                return await self.create_use_case.analyze(user_id, image, notes)
+
+        results = await asyncio.gather(
+            *(analyze(image) for image in images),
+            return_exceptions=True
+        )
+
+        analyzed = []
+        errors = []
+        for image, result in zip(images, results):
+            if isinstance(result, BaseException):
+                errors.append(
+                    ClassificationBulkError(
+                        filename=image.filename,
+                        detail=self._error_detail(result)
+                    )
+                )
+            else:
+                analyzed.append(result)
+
+        # A sessão do banco não aceita operações concorrentes; grava em sequência
+        items = []
+        for index, (image_path, classification) in enumerate(analyzed):
+            try:
+                items.append(
+                    await self.create_use_case.persist(user_id, image_path, classification)
+                )
+            except Exception:
+                # A falha desfaz a transação inteira (persist já removeu a
+                # imagem corrente); as demais imagens do lote ficariam órfãs
+                await self._delete_images(
+                    path for i, (path, _) in enumerate(analyzed) if i != index
+                )
+                raise
+
+        logger.info(
+            "Bulk classification finished",
+            user_id=user_id,
+            created=len(items),
+            failed=len(errors)
+        )
+
+        return ClassificationBulkResponse(items=items, errors=errors)
+
+    async def _delete_images(self, image_paths: Iterable[str]) -> None:
+        """Remove do disco as imagens informadas."""
+        storage = self.create_use_case.storage
+        await asyncio.gather(
+            *(asyncio.to_thread(storage.delete_image, path) for path in image_paths)
+        )
+
+    @staticmethod
+    def _error_detail(error: BaseException) -> str:
+        """Extrai a mensagem de erro exibível ao usuário."""
+        if isinstance(error, HTTPException):
+            return str(error.detail)
+        if isinstance(error, DemeterException):
+            return error.message
+        return "Erro ao processar imagem"
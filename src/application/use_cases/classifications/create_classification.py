@@ -1,14 +1,15 @@
 """Use case para criar classificação."""
 
+import asyncio
+
 from fastapi import UploadFile
 
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
 from src.infrastructure.services.storage_service import StorageService
 from src.infrastructure.services.mock_classifier_service import MockClassifierService
 from src.infrastructure.services.demeter_ml_service import DemeterMLService
-from src.application.schemas.classification import ClassificationResponse
+from src.application.schemas.classification import CLASSIFICATION_ADAPTER, ClassificationResponse
 from src.config.logging.logger import get_logger
-from src.config.settings import settings
 
 logger = get_logger(__name__)
 
@@ -16,16 +17,15 @@ logger = get_logger(__name__)
 class CreateClassificationUseCase:
     """Cria classificação com upload de imagem."""
 
-    def __init__(self, classification_repo: ClassificationRepositoryImpl):
+    def __init__(
+        self,
+        classification_repo: ClassificationRepositoryImpl,
+        storage: StorageService,
+        classifier: DemeterMLService | MockClassifierService
+    ):
         self.classification_repo = classification_repo
-        self.storage = StorageService()
-
-        if settings.USE_REAL_ML_API:
-            self.classifier = DemeterMLService()
-            logger.info("Using DemeterMLService (real AI)")
-        else:
-            self.classifier = MockClassifierService()
-            logger.info("Using MockClassifierService (simulated)")
+        self.storage = storage
+        self.classifier = classifier
 
     async def execute(
         self,
@@ -34,20 +34,47 @@ class CreateClassificationUseCase:
         notes: str | None = None
     ) -> ClassificationResponse:
         """Processa upload, classifica e salva."""
+        image_path, result = await self.analyze(user_id, image, notes)
+        return await self.persist(user_id, image_path, result)
+
+    async def analyze(
+        self,
+        user_id: int,
+        image: UploadFile,
+        notes: str | None = None
+    ) -> tuple[str, dict]:
+        """Salva a imagem e classifica, sem tocar no banco."""
         image_path = await self.storage.save_image(user_id, image)
 
-        result = await self.classifier.classify(image_path)
+        try:
+            result = await self.classifier.classify(image_path)
+        except Exception:
+            await asyncio.to_thread(self.storage.delete_image, image_path)
+            raise
 
         if notes:
             result["extra_data"]["notes"] = notes
 
-        classification = await self.classification_repo.create(
-            user_id=user_id,
-            image_path=image_path,
-            grain_type=result["grain_type"],
-            confidence_score=float(result["confidence_score"]) if result["confidence_score"] else None,
-            extra_data=result["extra_data"]
-        )
+        return image_path, result
+
+    async def persist(
+        self,
+        user_id: int,
+        image_path: str,
+        result: dict
+    ) -> ClassificationResponse:
+        """Grava o resultado da classificação."""
+        try:
+            classification = await self.classification_repo.create(
+                user_id=user_id,
+                image_path=image_path,
+                grain_type=result["grain_type"],
+                confidence_score=float(result["confidence_score"]) if result["confidence_score"] else None,
+                extra_data=result["extra_data"]
+            )
+        except Exception:
+            await asyncio.to_thread(self.storage.delete_image, image_path)
+            raise
 
         logger.info(
             "Classification created",
@@ -57,4 +84,4 @@ class CreateClassificationUseCase:
             is_real_ml=result["extra_data"].get("mock") == False
         )
 
-        return ClassificationResponse.model_validate(classification)
+        return CLASSIFICATION_ADAPTER.validate_python(classification, from_attributes=True)
@@ -1,7 +1,7 @@
 """Use case para buscar classificação."""
 
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
-from src.application.schemas.classification import ClassificationResponse
+from src.application.schemas.classification import CLASSIFICATION_ADAPTER, ClassificationResponse
 from src.config.exceptions.custom_exceptions import NotFoundError
 
 
@@ -26,4 +26,4 @@ class GetClassificationUseCase:
         if not classification:
             raise NotFoundError("Classificação não encontrada")
 
-        return ClassificationResponse.model_validate(classification)
+        return CLASSIFICATION_ADAPTER.validate_python(classification, from_attributes=True)
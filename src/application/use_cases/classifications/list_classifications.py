@@ -3,7 +3,10 @@
 from datetime import datetime
 
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
-from src.application.schemas.classification import ClassificationListResponse, ClassificationResponse
+from src.application.schemas.classification import (
+    CLASSIFICATION_LIST_ADAPTER,
+    ClassificationListResponse,
+)
 
 
 class ListClassificationsUseCase:
@@ -20,7 +23,7 @@ class ListClassificationsUseCase:
         grain_type: str | None = None
     ) -> ClassificationListResponse:
         """Lista classificações do usuário."""
-        classifications = await self.classification_repo.list_all(
+        classifications, total = await self.classification_repo.list_with_total(
             user_id=user_id,
             skip=skip,
             limit=limit,
@@ -28,13 +31,7 @@ class ListClassificationsUseCase:
             grain_type=grain_type
         )
 
-        total = await self.classification_repo.count(
-            user_id=user_id,
-            include_deleted=False,
-            grain_type=grain_type
-        )
-
-        items = [ClassificationResponse.model_validate(c) for c in classifications]
+        items = CLASSIFICATION_LIST_ADAPTER.validate_python(classifications, from_attributes=True)
 
         return ClassificationListResponse(
             items=items,
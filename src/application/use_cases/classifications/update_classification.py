@@ -1,7 +1,11 @@
 """Use case para atualizar classificação."""
 
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
-from src.application.schemas.classification import ClassificationUpdate, ClassificationResponse
+from src.application.schemas.classification import (
+    CLASSIFICATION_ADAPTER,
+    ClassificationResponse,
+    ClassificationUpdate,
+)
 from src.config.exceptions.custom_exceptions import NotFoundError
 
 
@@ -18,20 +22,20 @@ class UpdateClassificationUseCase:
         data: ClassificationUpdate
     ) -> ClassificationResponse:
         """Atualiza classificação do usuário."""
-        classification = await self.classification_repo.get_by_id(
-            classification_id=classification_id,
-            user_id=user_id,
-            include_deleted=False
-        )
+        if data.notes is None:
+            classification = await self.classification_repo.get_by_id(
+                classification_id=classification_id,
+                user_id=user_id,
+                include_deleted=False
+            )
+        else:
+            classification = await self.classification_repo.patch_notes(
+                classification_id=classification_id,
+                user_id=user_id,
+                notes=data.notes
+            )
 
         if not classification:
             raise NotFoundError("Classificação não encontrada")
 
-        if data.notes is not None:
-            if classification.extra_data is None:
-                classification.extra_data = {}
-            classification.extra_data["notes"] = data.notes
-
-        updated = await self.classification_repo.update(classification)
-
-        return ClassificationResponse.model_validate(updated)
+        return CLASSIFICATION_ADAPTER.validate_python(classification, from_attributes=True)
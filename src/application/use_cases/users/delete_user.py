@@ -3,8 +3,11 @@ Use Case para deleção de usuário.
 """
 
 from src.domain.repositories.user_repository import UserRepository
-from src.domain.repositories.refresh_token_repository import RefreshTokenRepository
 from src.config.exceptions.custom_exceptions import NotFoundError
+from src.application.use_cases.users.get_user import invalidate_user_cache
+from src.infrastructure.cache.user_permissions_cache import (
+    invalidate_user_permissions_cache,
+)
 from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,13 +18,8 @@ class DeleteUserUseCase:
     Use Case para deleção de usuário.
     """
 
-    def __init__(
-        self,
-        user_repository: UserRepository,
-        refresh_token_repository: RefreshTokenRepository,
-    ):
+    def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
-        self.refresh_token_repository = refresh_token_repository
 
     async def execute(self, user_id: int) -> dict:
         """
@@ -29,31 +27,23 @@ class DeleteUserUseCase:
         """
         logger.info("Deleting user", user_id=user_id)
 
-        user = await self.user_repository.get_by_id(user_id)
+        # Refresh tokens saem junto com o usuário via ON DELETE CASCADE
+        email = await self.user_repository.delete_returning_email(user_id)
 
-        if not user:
+        if email is None:
             logger.warning("Deletion failed - user not found", user_id=user_id)
             raise NotFoundError(
                 f"Usuário com ID {user_id} não encontrado",
                 details={"user_id": user_id},
             )
 
-        tokens_revoked = await self.refresh_token_repository.revoke_all_by_user(
-            user_id=user_id
-        )
-
-        logger.info(
-            "User tokens revoked before deletion",
-            user_id=user_id,
-            tokens_revoked=tokens_revoked,
-        )
-
-        await self.user_repository.delete(user_id)
+        invalidate_user_cache(user_id)
+        invalidate_user_permissions_cache(user_id)
 
         logger.info(
             "User deleted successfully",
             user_id=user_id,
-            email=user.email,
+            email=email,
         )
 
         return {
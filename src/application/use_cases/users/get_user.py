@@ -2,7 +2,9 @@
 Use Case para obter dados de um usuário.
 """
 
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from typing import Tuple
 
 from src.domain.repositories.user_repository import UserRepository
 from src.application.schemas.user import UserResponse
@@ -11,6 +13,15 @@ from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+_USER_CACHE_SIZE = 10_000
+_USER_CACHE_TTL_SECONDS = 5.0
+_user_cache: "OrderedDict[int, Tuple[float, UserResponse]]" = OrderedDict()
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Remove o usuário do cache (chamado após update, delete e login)."""
+    _user_cache.pop(user_id, None)
+
 
 class GetUserUseCase:
     """
@@ -26,6 +37,14 @@ class GetUserUseCase:
         """
         logger.debug("Fetching user", user_id=user_id)
 
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            expires_at, response = cached
+            if expires_at > time.monotonic():
+                _user_cache.move_to_end(user_id)
+                return response
+            del _user_cache[user_id]
+
         user = await self.user_repository.get_by_id(user_id)
 
         if not user:
@@ -35,13 +54,10 @@ class GetUserUseCase:
                 details={"user_id": user_id},
             )
 
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            phone=user.phone,
-            is_active=user.is_active,
-            is_verified=user.is_verified,
-            created_at=user.created_at or datetime.now(timezone.utc),
-            last_login=user.last_login,
-        )
+        response = UserResponse.from_entity(user)
+
+        _user_cache[user_id] = (time.monotonic() + _USER_CACHE_TTL_SECONDS, response)
+        if len(_user_cache) > _USER_CACHE_SIZE:
+            _user_cache.popitem(last=False)
+
+        return response
@@ -6,66 +6,80 @@ import argparse
 import asyncio
 from datetime import datetime, timezone
 
+from sqlalchemy import insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from src.config.db.database import async_session_maker
-from src.config.security.password import get_password_hash
+from src.config.security.password import hash_password_async
 from src.infrastructure.models.user import User
-from src.infrastructure.repositories.role_repository_impl import RoleRepositoryImpl
+from src.infrastructure.models.role import Role
+from src.infrastructure.models.user_role import UserRole
 from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 async def create_admin(email: str, name: str, password: str, phone: str):
-    """Cria usuário admin no sistema."""
+    """
+    Cria usuário admin no sistema.
+
+    Usuário e vínculo com a role admin são inseridos em um único comando
+    (CTE com INSERT ... ON CONFLICT DO NOTHING RETURNING).
+    """
+    hashed_password = await hash_password_async(password)
+    now = datetime.now(timezone.utc)
+
+    new_user = (
+        pg_insert(User)
+        .values(
+            email=email,
+            name=name,
+            phone=phone,
+            hashed_password=hashed_password,
+            is_active=True,
+            is_verified=True,
+            is_deleted=False,
+            created_at=now,
+            updated_at=now,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id)
+        .cte("new_user")
+    )
+    stmt = (
+        insert(UserRole)
+        .from_select(
+            ["user_id", "role_id", "assigned_at"],
+            select(new_user.c.id, Role.id, literal(now)).where(Role.name == "admin"),
+        )
+        .returning(UserRole.user_id)
+    )
+
     async with async_session_maker() as db:
         try:
-            from sqlalchemy import select
-            stmt = select(User).where(User.email == email)
             result = await db.execute(stmt)
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                print(f"Erro: Email '{email}' já cadastrado")
-                logger.warning(f"Admin creation failed: email already exists", email=email)
-                return
+            user_id = result.scalar_one_or_none()
 
-            hashed_password = get_password_hash(password)
-            user = User(
-                email=email,
-                name=name,
-                phone=phone,
-                hashed_password=hashed_password,
-                is_active=True,
-                is_verified=True,
-            )
-
-            db.add(user)
-            await db.flush()
-            await db.refresh(user)
-
-            role_repo = RoleRepositoryImpl(db)
-            admin_role = await role_repo.get_by_name("admin")
-
-            if not admin_role:
-                print("Erro: Role 'admin' não encontrada no banco")
-                logger.error("Admin creation failed: admin role not found")
+            if user_id is None:
                 await db.rollback()
-                return
 
-            await role_repo.assign_role_to_user(
-                user_id=user.id,
-                role_id=admin_role.id,
-                assigned_by=None
-            )
+                existing = await db.execute(select(User.id).where(User.email == email).limit(1))
+                if existing.scalar_one_or_none() is not None:
+                    print(f"Erro: Email '{email}' já cadastrado")
+                    logger.warning(f"Admin creation failed: email already exists", email=email)
+                else:
+                    print("Erro: Role 'admin' não encontrada no banco")
+                    logger.error("Admin creation failed: admin role not found")
+                return
 
             await db.commit()
 
             print(" Admin criado com sucesso!")
             print(f"   Email: {email}")
             print(f"   Nome: {name}")
-            print(f"   ID: {user.id}")
+            print(f"   ID: {user_id}")
 
-            logger.info(f"Admin user created successfully", user_id=user.id, email=email)
+            logger.info(f"Admin user created successfully", user_id=user_id, email=email)
 
         except Exception as e:
             await db.rollback()
@@ -4,10 +4,13 @@ Comando CLI para popular roles e permissions iniciais.
 
 import asyncio
 
+from sqlalchemy import insert, select
+
 from src.config.db.database import async_session_maker
 from src.infrastructure.models.role import Role
 from src.infrastructure.models.permission import Permission
 from src.infrastructure.models.role_permission import RolePermission
+from src.infrastructure.repositories.role_repository_impl import clear_role_id_cache
 from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,104 +20,117 @@ async def seed_roles_and_permissions():
     """Popula roles e permissions iniciais no banco."""
     async with async_session_maker() as db:
         try:
-            from sqlalchemy import select
-            result = await db.execute(select(Role))
-            existing_roles = result.scalars().all()
+            result = await db.execute(select(Role.id).limit(1))
 
-            if existing_roles:
+            if result.scalar_one_or_none() is not None:
                 print("⚠ Roles já existem no banco. Pulando seed.")
                 logger.info("Seed skipped: roles already exist")
                 return
 
             print("Criando roles...")
-            classificador_role = Role(
-                name="classificador",
-                description="Usuário classificador",
-                is_system=True
-            )
-            admin_role = Role(
-                name="admin",
-                description="Administrador do sistema",
-                is_system=True
+            result = await db.execute(
+                insert(Role)
+                .values(
+                    [
+                        {
+                            "name": "classificador",
+                            "description": "Usuário classificador",
+                            "is_system": True,
+                        },
+                        {
+                            "name": "admin",
+                            "description": "Administrador do sistema",
+                            "is_system": True,
+                        },
+                    ]
+                )
+                .returning(Role.id, Role.name)
             )
+            role_ids = {name: role_id for role_id, name in result.all()}
+            classificador_role_id = role_ids["classificador"]
+            admin_role_id = role_ids["admin"]
 
-            db.add_all([classificador_role, admin_role])
-            await db.flush()
-
-            print(f"   ✓ Role 'classificador' criada (ID: {classificador_role.id})")
-            print(f"   ✓ Role 'admin' criada (ID: {admin_role.id})")
+            print(f"   ✓ Role 'classificador' criada (ID: {classificador_role_id})")
+            print(f"   ✓ Role 'admin' criada (ID: {admin_role_id})")
 
             print("\nCriando permissions...")
             permissions = [
-                Permission(
-                    name="classifications:create:own",
-                    resource="classifications",
-                    action="create",
-                    scope="own",
-                    description="Criar suas próprias classificações"
-                ),
-                Permission(
-                    name="classifications:read:own",
-                    resource="classifications",
-                    action="read",
-                    scope="own",
-                    description="Visualizar suas próprias classificações"
-                ),
-                Permission(
-                    name="classifications:update:own",
-                    resource="classifications",
-                    action="update",
-                    scope="own",
-                    description="Atualizar suas próprias classificações"
-                ),
-                Permission(
-                    name="classifications:delete:own",
-                    resource="classifications",
-                    action="delete",
-                    scope="own",
-                    description="Deletar suas próprias classificações"
-                ),
-                Permission(
-                    name="classifications:read:all",
-                    resource="classifications",
-                    action="read",
-                    scope="all",
-                    description="Visualizar todas as classificações"
-                ),
-                Permission(
-                    name="classifications:delete:all",
-                    resource="classifications",
-                    action="delete",
-                    scope="all",
-                    description="Deletar qualquer classificação"
-                ),
+                {
+                    "name": "classifications:create:own",
+                    "resource": "classifications",
+                    "action": "create",
+                    "scope": "own",
+                    "description": "Criar suas próprias classificações",
+                },
+                {
+                    "name": "classifications:read:own",
+                    "resource": "classifications",
+                    "action": "read",
+                    "scope": "own",
+                    "description": "Visualizar suas próprias classificações",
+                },
+                {
+                    "name": "classifications:update:own",
+                    "resource": "classifications",
+                    "action": "update",
+                    "scope": "own",
+                    "description": "Atualizar suas próprias classificações",
+                },
+                {
+                    "name": "classifications:delete:own",
+                    "resource": "classifications",
+                    "action": "delete",
+                    "scope": "own",
+                    "description": "Deletar suas próprias classificações",
+                },
+                {
+                    "name": "classifications:read:all",
+                    "resource": "classifications",
+                    "action": "read",
+                    "scope": "all",
+                    "description": "Visualizar todas as classificações",
+                },
+                {
+                    "name": "classifications:delete:all",
+                    "resource": "classifications",
+                    "action": "delete",
+                    "scope": "all",
+                    "description": "Deletar qualquer classificação",
+                },
             ]
 
-            db.add_all(permissions)
-            await db.flush()
+            result = await db.execute(
+                insert(Permission)
+                .values(permissions)
+                .returning(Permission.id, Permission.name)
+            )
+            permission_ids = {name: perm_id for perm_id, name in result.all()}
 
-            for perm in permissions:
-                print(f"   ✓ Permission '{perm.name}' criada (ID: {perm.id})")
+            for name, perm_id in permission_ids.items():
+                print(f"   ✓ Permission '{name}' criada (ID: {perm_id})")
 
             print("\n📝 Associando permissions às roles...")
 
-            for perm in permissions[:4]:
-                role_perm = RolePermission(
-                    role_id=classificador_role.id,
-                    permission_id=perm.id
-                )
-                db.add(role_perm)
-            print(f"   ✓ 4 permissions associadas à role 'classificador'")
-
-            for perm in permissions:
-                role_perm = RolePermission(
-                    role_id=admin_role.id,
-                    permission_id=perm.id
+            own_ids = [permission_ids[perm["name"]] for perm in permissions[:4]]
+            all_ids = [permission_ids[perm["name"]] for perm in permissions]
+
+            await db.execute(
+                insert(RolePermission).values(
+                    [
+                        {"role_id": classificador_role_id, "permission_id": perm_id}
+                        for perm_id in own_ids
+                    ]
+                    + [
+                        {"role_id": admin_role_id, "permission_id": perm_id}
+                        for perm_id in all_ids
+                    ]
                 )
-                db.add(role_perm)
-            print(f"   ✓ {len(permissions)} permissions associadas à role 'admin'")
+            )
+            print(f"   ✓ {len(own_ids)} permissions associadas à role 'classificador'")
+            print(f"   ✓ {len(all_ids)} permissions associadas à role 'admin'")
 
             await db.commit()
+            clear_role_id_cache()
 
             print("\n✅ Seed concluído com sucesso!")
             logger.info(
@@ -2,7 +2,7 @@
 Módulo de configuração central da aplicação DEMETER.
 """
 
-from src.config.settings import settings
+from src.config.settings import get_settings, settings
 from src.config.db.database import database, Base, DatabaseEngine
 from src.config.db.dependencies import get_db, get_db_context, DbSessionDep
 
@@ -14,7 +14,9 @@ from src.config.security.auth import (
 )
 from src.config.security.password import (
     get_password_hash,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     validate_password_strength,
 )
 
@@ -47,6 +49,7 @@ from src.config.dependencies.common import (
 
 __all__ = [
     "settings",
+    "get_settings",
     "database",
     "Base",
     "DatabaseEngine",
@@ -58,7 +61,9 @@ __all__ = [
     "verify_token",
     "decode_token",
     "get_password_hash",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
     "validate_password_strength",
     "logger",
     "get_logger",
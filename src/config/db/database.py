@@ -7,7 +7,8 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase, declared_attr
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from src.config.settings import settings
 
@@ -28,12 +29,14 @@ class Base(DeclarativeBase):
     """
     metadata = metadata
 
-    @declared_attr.directive
-    def __tablename__(cls) -> str:
+    def __init_subclass__(cls, **kwargs) -> None:
         """
-        Gera nome de tabela automaticamente baseado no nome da classe.
+        Gera nome de tabela automaticamente baseado no nome da classe,
+        quando o modelo não define __tablename__.
         """
-        return cls.__name__.lower() + "s"
+        if "__tablename__" not in cls.__dict__:
+            cls.__tablename__ = cls.__name__.lower() + "s"
+        super().__init_subclass__(**kwargs)
 
 
 class DatabaseEngine:
@@ -45,7 +48,8 @@ class DatabaseEngine:
         self._engine: AsyncEngine = create_async_engine(
             url=settings.database_url_str,
             echo=settings.DATABASE_ECHO,
-            pool_pre_ping=True,
+            connect_args=self._connect_args(),
+            **self._pool_options(),
         )
 
         self._session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
@@ -56,6 +60,32 @@ class DatabaseEngine:
             expire_on_commit=False,
         )
 
+    @staticmethod
+    def _pool_options() -> dict:
+        """Opções de pool; NullPool quando DATABASE_USE_NULL_POOL (testes)."""
+        if settings.DATABASE_USE_NULL_POOL:
+            return {"poolclass": NullPool}
+
+        return {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": settings.DATABASE_POOL_SIZE,
+            "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+            "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+            "pool_pre_ping": True,
+        }
+
+    @staticmethod
+    def _connect_args() -> dict:
+        """Argumentos do asyncpg: JIT desligado para queries OLTP curtas."""
+        connect_args: dict = {"server_settings": {"jit": "off"}}
+
+        if settings.DATABASE_PGBOUNCER:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+
+        return connect_args
+
     @property
     def engine(self) -> AsyncEngine:
         """Retorna o engine assíncrono"""
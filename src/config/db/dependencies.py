@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Annotated
 
 from fastapi import Depends
@@ -5,31 +6,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.db.database import database
 
+_session_factory = database.session_factory
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """ dependecia que fornece uma sessão do banco de dados para as rotas do FastAPI"""
-    async with database.session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    async with _session_factory() as session:
+        yield session
+        await session.commit()
 
 
 DbSessionDep = Annotated[AsyncSession, Depends(get_db)]
 
 
-async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
-    """ context manager assícrono para acesso ao banco fora de routers """
-    async with database.session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
\ No newline at end of file
+# context manager assícrono para acesso ao banco fora de routers
+get_db_context = asynccontextmanager(get_db)
@@ -2,19 +2,54 @@
 Dependencies comuns para rotas do FastAPI.
 """
 
+from functools import lru_cache
 from typing import Annotated, Dict, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose.exceptions import ExpiredSignatureError, JWTError
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config.security.auth import verify_token
+from src.config.security.auth import verify_token_cached
 from src.config.db.dependencies import get_db
+from src.config.settings import settings
+from src.infrastructure.cache.user_permissions_cache import (
+    cache_user_permissions,
+    get_cached_user_permissions,
+    invalidate_user_permissions_cache,
+)
 
 security = HTTPBearer()
 
+_user_repository_cls = None
+
+
+def _get_user_repository_cls():
+    """
+    Importa UserRepositoryImpl uma única vez.
+
+    O import no topo do módulo cria ciclo (models -> src.config -> dependencies).
+    """
+    global _user_repository_cls
+    if _user_repository_cls is None:
+        from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+        _user_repository_cls = UserRepositoryImpl
+    return _user_repository_cls
+
+
+def _parse_user_id(sub: Any) -> int | None:
+    """
+    Converte o claim "sub" em int sem usar exceções no caminho comum.
+
+    O "sub" é sempre string no JWT (RFC 7519); aceita apenas dígitos ASCII.
+    """
+    if isinstance(sub, int) and not isinstance(sub, bool):
+        return sub if sub > 0 else None
+    if isinstance(sub, str) and sub.isascii() and sub.isdigit():
+        return int(sub)
+    return None
+
 
 async def get_current_user_payload(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
@@ -25,7 +60,7 @@ async def get_current_user_payload(
     token = credentials.credentials
 
     try:
-        payload = verify_token(token, token_type="access")
+        payload = verify_token_cached(token, token_type="access")
         return payload
 
     except ExpiredSignatureError:
@@ -34,7 +69,7 @@ async def get_current_user_payload(
             detail="Token expirado. Por favor, faça login novamente.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except JWTError as e:
+    except InvalidTokenError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Token inválido: {str(e)}",
@@ -63,14 +98,14 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    try:
-        return int(user_id)
-    except (ValueError, TypeError):
+    parsed = _parse_user_id(user_id)
+    if parsed is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="ID de usuário inválido no token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return parsed
 
 
 async def get_current_user(
@@ -100,7 +135,7 @@ async def get_refresh_token_payload(
     token = credentials.credentials
 
     try:
-        payload = verify_token(token, token_type="refresh")
+        payload = verify_token_cached(token, token_type="refresh")
         return payload
 
     except ExpiredSignatureError:
@@ -115,7 +150,7 @@ async def get_refresh_token_payload(
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except JWTError as e:
+    except InvalidTokenError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Refresh token inválido: {str(e)}",
@@ -129,19 +164,23 @@ async def get_current_user_with_permissions(
 ) -> Dict[str, Any]:
     """Carrega usuário com roles e permissions do banco."""
 
-    from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
-
-    user_id = payload.get("sub")
+    user_id = _parse_user_id(payload.get("sub"))
 
-    if not user_id:
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_repo = UserRepositoryImpl(db)
-    user = await user_repo.get_by_id_with_roles(int(user_id))
+    ttl = settings.USER_PERMISSIONS_CACHE_TTL_SECONDS
+
+    cached = get_cached_user_permissions(user_id)
+    if cached is not None:
+        return cached
+
+    user_repo = _get_user_repository_cls()(db)
+    user = await user_repo.get_auth_context(user_id)
 
     if not user:
         raise HTTPException(
@@ -150,61 +189,70 @@ async def get_current_user_with_permissions(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if not user.is_active:
+    if not user["is_active"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Usuário inativo",
         )
 
-    if user.is_deleted:
+    if user["is_deleted"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Usuário deletado",
         )
 
-    permissions = set()
-    roles = []
-
-    for user_role in user.user_roles:
-        roles.append(user_role.role.name)
-        for role_permission in user_role.role.role_permissions:
-            permissions.add(role_permission.permission.name)
-
-    return {
-        "id": user.id,
-        "email": user.email,
-        "name": user.name,
+    roles = user["roles"]
+    current_user = {
+        "id": user["id"],
+        "email": user["email"],
+        "name": user["name"],
         "roles": roles,
-        "permissions": list(permissions),
+        "permissions": user["permissions"],
         "is_admin": "admin" in roles
     }
 
+    if ttl > 0:
+        cache_user_permissions(user_id, current_user, ttl)
+
+    return current_user
 
 
+
+@lru_cache(maxsize=None)
 def require_permission(permission: str):
-    """Factory que retorna dependency para verificar permissão específica."""
+    """
+    Factory que retorna dependency para verificar permissão específica.
+
+    Memoizada: a mesma permissão devolve o mesmo checker, que o FastAPI
+    resolve uma única vez por requisição.
+    """
+    detail = f"Permissão necessária: {permission}"
+
     async def permission_checker(
         user: Annotated[Dict[str, Any], Depends(get_current_user_with_permissions)]
     ) -> Dict[str, Any]:
         if permission not in user["permissions"]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permissão necessária: {permission}"
+                detail=detail
             )
         return user
 
     return permission_checker
 
 
+@lru_cache(maxsize=None)
 def require_role(role: str):
     """Factory que retorna dependency para verificar role específica."""
+    detail = f"Role necessária: {role}"
+
     async def role_checker(
         user: Annotated[Dict[str, Any], Depends(get_current_user_with_permissions)]
     ) -> Dict[str, Any]:
         if role not in user["roles"]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role necessária: {role}"
+                detail=detail
             )
         return user
 
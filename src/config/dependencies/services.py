@@ -0,0 +1,59 @@
+"""
+Dependencies de serviços de infraestrutura compartilhados.
+"""
+
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.config.logging.logger import get_logger
+from src.config.settings import settings
+from src.infrastructure.services.storage_service import StorageService
+from src.infrastructure.services.mock_classifier_service import MockClassifierService
+from src.infrastructure.services.demeter_ml_service import DemeterMLService
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _storage_service() -> StorageService:
+    """Cria a instância única do serviço de armazenamento."""
+    return StorageService()
+
+
+@lru_cache(maxsize=1)
+def _classifier_service() -> DemeterMLService | MockClassifierService:
+    """Cria a instância única do classificador configurado."""
+    if settings.USE_REAL_ML_API:
+        logger.info("Using DemeterMLService (real AI)")
+        return DemeterMLService()
+
+    logger.info("Using MockClassifierService (simulated)")
+    return MockClassifierService()
+
+
+# Dependencies async: funções sync seriam executadas no threadpool a cada requisição
+async def get_storage_service() -> StorageService:
+    """Retorna a instância única do serviço de armazenamento."""
+    return _storage_service()
+
+
+async def get_classifier_service() -> DemeterMLService | MockClassifierService:
+    """Retorna a instância única do classificador configurado."""
+    return _classifier_service()
+
+
+async def close_services() -> None:
+    """Fecha os recursos dos serviços compartilhados já instanciados."""
+    if _classifier_service.cache_info().currsize:
+        classifier = _classifier_service()
+        if isinstance(classifier, DemeterMLService):
+            await classifier.aclose()
+
+
+StorageServiceDep = Annotated[StorageService, Depends(get_storage_service)]
+ClassifierServiceDep = Annotated[
+    DemeterMLService | MockClassifierService,
+    Depends(get_classifier_service),
+]
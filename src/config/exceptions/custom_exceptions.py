@@ -2,6 +2,7 @@
 Exceções personalizadas da aplicação DEMETER.
 """
 
+from functools import cached_property
 from typing import Any, Dict, Optional
 
 
@@ -19,18 +20,26 @@ class DemeterException(Exception):
         self.message = message
         self.status_code = status_code
         self.details = details or {}
+        self.error_name = type(self).__name__
         super().__init__(self.message)
 
-    def to_dict(self) -> Dict[str, Any]:
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
         """
-        Converte a exceção para um dicionário.
+        Corpo da resposta de erro, montado uma única vez por exceção.
         """
         return {
-            "error": self.__class__.__name__,
+            "error": self.error_name,
             "message": self.message,
             "details": self.details,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converte a exceção para um dicionário.
+        """
+        return dict(self.payload)
+
 
 class AuthenticationError(DemeterException):
     """
@@ -2,12 +2,14 @@
 Handlers globais de exceções para o FastAPI.
 """
 
+import logging
 from typing import Union
 
-from fastapi import FastAPI, Request, status
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from jose.exceptions import JWTError, ExpiredSignatureError
+from fastapi.responses import ORJSONResponse
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.config.exceptions.custom_exceptions import DemeterException
@@ -16,57 +18,68 @@ from src.config.logging.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _static_body(error: str, message: str) -> bytes:
+    """Serializa uma única vez o corpo de erros com conteúdo fixo."""
+    return orjson.dumps({"error": error, "message": message, "details": {}})
+
+
+_EXPIRED_TOKEN_BODY = _static_body("AuthenticationError", "Token expirado")
+_INVALID_TOKEN_BODY = _static_body("AuthenticationError", "Token inválido")
+_DATABASE_ERROR_BODY = _static_body(
+    "DatabaseError", "Erro ao processar operação no banco de dados"
+)
+_INTERNAL_ERROR_BODY = _static_body("InternalServerError", "Erro interno do servidor")
+
+
 async def demeter_exception_handler(
     request: Request,
     exc: DemeterException,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handler para exceções personalizadas da aplicação (DemeterException).
     """
-    logger.warning(
-        "Application exception",
-        exception_type=exc.__class__.__name__,
-        message=exc.message,
+    if logger.is_enabled_for(logging.WARNING):
+        logger.warning(
+            "Application exception",
+            exception_type=exc.error_name,
+            message=exc.message,
+            status_code=exc.status_code,
+            path=request.scope["path"],
+            method=request.scope["method"],
+            details=exc.details,
+        )
+
+    return ORJSONResponse(
         status_code=exc.status_code,
-        path=request.url.path,
-        method=request.method,
-        details=exc.details,
-    )
-
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": exc.__class__.__name__,
-            "message": exc.message,
-            "details": exc.details,
-        },
+        content=exc.payload,
     )
 
 
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handler para erros de validação do Pydantic.
     """
-    errors = []
-    for error in exc.errors():
-        field = " -> ".join(str(loc) for loc in error["loc"])
-        errors.append({
-            "field": field,
+    errors = [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
             "message": error["msg"],
             "type": error["type"],
-        })
-
-    logger.warning(
-        "Validation error",
-        path=request.url.path,
-        method=request.method,
-        errors=errors,
-    )
-
-    return JSONResponse(
+        }
+        for error in exc.errors()
+    ]
+
+    if logger.is_enabled_for(logging.WARNING):
+        logger.warning(
+            "Validation error",
+            path=request.scope["path"],
+            method=request.scope["method"],
+            errors=errors,
+        )
+
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "ValidationError",
@@ -78,31 +91,26 @@ async def validation_exception_handler(
 
 async def jwt_exception_handler(
     request: Request,
-    exc: Union[JWTError, ExpiredSignatureError],
-) -> JSONResponse:
+    exc: Union[InvalidTokenError, ExpiredSignatureError],
+) -> Response:
     """
     Handler para erros de JWT.
     """
-    logger.warning(
-        "JWT error",
-        exception_type=exc.__class__.__name__,
-        path=request.url.path,
-        method=request.method,
-        error=str(exc),
-    )
-
-    if isinstance(exc, ExpiredSignatureError):
-        message = "Token expirado"
-    else:
-        message = "Token inválido"
-
-    return JSONResponse(
+    if logger.is_enabled_for(logging.WARNING):
+        logger.warning(
+            "JWT error",
+            exception_type=exc.__class__.__name__,
+            path=request.scope["path"],
+            method=request.scope["method"],
+            error=str(exc),
+        )
+
+    body = _EXPIRED_TOKEN_BODY if isinstance(exc, ExpiredSignatureError) else _INVALID_TOKEN_BODY
+
+    return Response(
+        content=body,
         status_code=status.HTTP_401_UNAUTHORIZED,
-        content={
-            "error": "AuthenticationError",
-            "message": message,
-            "details": {},
-        },
+        media_type="application/json",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
@@ -110,67 +118,65 @@ async def jwt_exception_handler(
 async def database_exception_handler(
     request: Request,
     exc: SQLAlchemyError,
-) -> JSONResponse:
+) -> Response:
     """
     Handler para erros do SQLAlchemy.
     """
-    logger.error(
-        "Database error",
-        exception_type=exc.__class__.__name__,
-        path=request.url.path,
-        method=request.method,
-        error=str(exc),
-    )
-
-    return JSONResponse(
+    if logger.is_enabled_for(logging.ERROR):
+        logger.error(
+            "Database error",
+            exception_type=exc.__class__.__name__,
+            path=request.scope["path"],
+            method=request.scope["method"],
+            error=str(exc),
+        )
+
+    return Response(
+        content=_DATABASE_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "DatabaseError",
-            "message": "Erro ao processar operação no banco de dados",
-            "details": {},
-        },
+        media_type="application/json",
     )
 
 
 async def generic_exception_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
+) -> Response:
     """
     Handler genérico para exceções não tratadas.
     """
-    logger.error(
-        "Unhandled exception",
-        exception_type=exc.__class__.__name__,
-        path=request.url.path,
-        method=request.method,
-        error=str(exc),
-        exc_info=True,
-    )
-
-    return JSONResponse(
+    if logger.is_enabled_for(logging.ERROR):
+        logger.error(
+            "Unhandled exception",
+            exception_type=exc.__class__.__name__,
+            path=request.scope["path"],
+            method=request.scope["method"],
+            error=str(exc),
+            exc_info=True,
+        )
+
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "InternalServerError",
-            "message": "Erro interno do servidor",
-            "details": {},
-        },
+        media_type="application/json",
     )
 
 
+_HANDLERS = (
+    (DemeterException, demeter_exception_handler),
+    (RequestValidationError, validation_exception_handler),
+    (InvalidTokenError, jwt_exception_handler),
+    (ExpiredSignatureError, jwt_exception_handler),
+    (SQLAlchemyError, database_exception_handler),
+    (Exception, generic_exception_handler),
+)
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """
     Registra todos os handlers de exceção na aplicação FastAPI.
     """
-    app.add_exception_handler(DemeterException, demeter_exception_handler)
-
-    app.add_exception_handler(RequestValidationError, validation_exception_handler)
-
-    app.add_exception_handler(JWTError, jwt_exception_handler)
-    app.add_exception_handler(ExpiredSignatureError, jwt_exception_handler)
-
-    app.add_exception_handler(SQLAlchemyError, database_exception_handler)
-
-    app.add_exception_handler(Exception, generic_exception_handler)
+    for exc_class, handler in _HANDLERS:
+        app.add_exception_handler(exc_class, handler)
 
     logger.info("Exception handlers registered successfully")
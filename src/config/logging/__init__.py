@@ -13,6 +13,7 @@ from src.config.logging.logger import (
     log_request,
     log_auth_event,
     log_database_operation,
+    log_database_operation_lazy,
 )
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     "log_request",
     "log_auth_event",
     "log_database_operation",
+    "log_database_operation_lazy",
 ]
@@ -3,92 +3,197 @@
 Configuração de logging estruturado usando structlog.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+import orjson
 import structlog
-from pythonjsonlogger import jsonlogger
+from structlog.typing import FilteringBoundLogger
 
 from src.config.settings import settings
 
 
-def setup_logging() -> structlog.BoundLogger:
+def _orjson_dumps(obj: Any, default: Any = None) -> str:
+    """
+    Serializa o evento com orjson, devolvendo str para os handlers stdlib.
+    """
+    return orjson.dumps(obj, default=default).decode()
+
+
+# Processadores aplicados tanto aos eventos do structlog quanto aos registros
+# de bibliotecas terceiras (foreign_pre_chain); o renderer fica no formatter.
+_JSON_PROCESSORS = (
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+)
+
+_CONSOLE_PROCESSORS = (
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+)
+
+
+_LOG_FLUSH_INTERVAL_SECONDS = 0.1
+_ROLLOVER_CHECK_INTERVAL = 1024
+
+_configured_pid: int | None = None
+_logger: FilteringBoundLogger | None = None
+_queue_listener: logging.handlers.QueueListener | None = None
+_buffered_handlers: list[logging.handlers.MemoryHandler] = []
+_flush_stop = threading.Event()
+
+
+class _SampledRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler que só consulta o tamanho do arquivo a cada
+    _ROLLOVER_CHECK_INTERVAL registros, em vez de seek/tell a cada emit.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._records_since_check = 0
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        self._records_since_check += 1
+        if self._records_since_check < _ROLLOVER_CHECK_INTERVAL:
+            return False
+        self._records_since_check = 0
+        return bool(super().shouldRollover(record))
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler para fila em processo: entrega o registro intacto, deixando
+    a formatação para os handlers do listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _buffered(
+    target: logging.Handler, capacity: int
+) -> logging.handlers.MemoryHandler:
+    """
+    Agrupa as escritas de um handler; registros ERROR descarregam na hora.
+    """
+    handler = logging.handlers.MemoryHandler(
+        capacity=capacity, flushLevel=logging.ERROR, target=target
+    )
+    handler.setLevel(target.level)
+    return handler
+
+
+def _flush_periodically(stop: threading.Event) -> None:
+    """
+    Descarrega os buffers de arquivo a cada intervalo, limitando a latência.
+    """
+    while not stop.wait(_LOG_FLUSH_INTERVAL_SECONDS):
+        for handler in _buffered_handlers:
+            handler.flush()
+
+
+def _stop_queue_listener() -> None:
+    """
+    Para o listener de arquivos, descarregando a fila e os buffers pendentes.
+    """
+    global _queue_listener, _flush_stop
+    _flush_stop.set()
+    _flush_stop = threading.Event()
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    for handler in _buffered_handlers:
+        handler.flush()
+    _buffered_handlers.clear()
+
+
+def setup_logging() -> FilteringBoundLogger:
     """
     Configura o sistema de logging da aplicação.
+
+    Idempotente por processo: workers criados via fork não herdam as threads
+    de escrita em arquivo e por isso são reconfigurados.
     """
+    global _configured_pid, _logger, _queue_listener
+
+    if _logger is not None and _configured_pid == os.getpid():
+        return _logger
+
     log_dir = Path(settings.LOG_DIR)
     log_dir.mkdir(exist_ok=True)
 
     log_level = getattr(logging, settings.LOG_LEVEL.upper())
 
-    if settings.LOG_FORMAT == "json":
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
-        ]
-    else:
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+    shared_processors = (
+        _JSON_PROCESSORS if settings.LOG_FORMAT == "json" else _CONSOLE_PROCESSORS
+    )
 
     structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            *shared_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
+    # Eventos do structlog chegam já processados e são renderizados uma única
+    # vez; registros de bibliotecas terceiras passam pelo foreign_pre_chain.
+    json_formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ],
+        foreign_pre_chain=shared_processors,
+    )
+
     handlers = []
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
 
     if settings.LOG_FORMAT == "json":
-        json_formatter = jsonlogger.JsonFormatter(
-            "%(asctime)s %(name)s %(levelname)s %(message)s",
-            timestamp=True,
-        )
         console_handler.setFormatter(json_formatter)
     else:
-        console_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
+        console_handler.setFormatter(
+            structlog.stdlib.ProcessorFormatter(
+                processors=[
+                    structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                    structlog.dev.ConsoleRenderer(colors=True),
+                ],
+                foreign_pre_chain=shared_processors,
+            )
         )
-        console_handler.setFormatter(console_formatter)
 
     handlers.append(console_handler)
 
     if settings.ENVIRONMENT == "production" or settings.LOG_FORMAT == "json":
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _SampledRotatingFileHandler(
             filename=log_dir / "demeter-api.log",
             maxBytes=10 * 1024 * 1024,
             backupCount=10,
             encoding="utf-8",
         )
         file_handler.setLevel(log_level)
-
-        json_formatter = jsonlogger.JsonFormatter(
-            "%(asctime)s %(name)s %(levelname)s %(message)s",
-            timestamp=True,
-        )
         file_handler.setFormatter(json_formatter)
-        handlers.append(file_handler)
 
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = _SampledRotatingFileHandler(
             filename=log_dir / "demeter-api-errors.log",
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=10,
@@ -96,7 +201,25 @@ def setup_logging() -> structlog.BoundLogger:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(json_formatter)
-        handlers.append(error_handler)
+
+        # Escrita em disco e rotação acontecem na thread do listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handlers.append(_LocalQueueHandler(log_queue))
+
+        _stop_queue_listener()
+        _buffered_handlers.extend(
+            (_buffered(file_handler, 512), _buffered(error_handler, 64))
+        )
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *_buffered_handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        threading.Thread(
+            target=_flush_periodically,
+            args=(_flush_stop,),
+            name="log-flush",
+            daemon=True,
+        ).start()
 
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -119,10 +242,15 @@ def setup_logging() -> structlog.BoundLogger:
         environment=settings.ENVIRONMENT,
     )
 
+    _configured_pid = os.getpid()
+    _logger = logger
     return logger
 
 
-def get_logger(name: str) -> structlog.BoundLogger:
+atexit.register(_stop_queue_listener)
+
+
+def get_logger(name: str) -> FilteringBoundLogger:
     """
     Obtém um logger nomeado.
     """
@@ -130,18 +258,23 @@ def get_logger(name: str) -> structlog.BoundLogger:
 
 
 def log_request(
-    logger: structlog.BoundLogger,
     method: str,
     path: str,
     status_code: int,
     duration_ms: float,
+    logger: FilteringBoundLogger | None = None,
     **kwargs: Any,
 ) -> None:
     """
     Loga uma requisição HTTP.
     """
+    logger = logger or _app_logger
+    level = logging.ERROR if status_code >= 500 else logging.WARNING if status_code >= 400 else logging.INFO
+    if not logger.is_enabled_for(level):
+        return
+
     log_data = {
-        "event": "http_request",
+        "event_category": "http_request",
         "method": method,
         "path": path,
         "status_code": status_code,
@@ -158,17 +291,21 @@ def log_request(
 
 
 def log_auth_event(
-    logger: structlog.BoundLogger,
     event_type: str,
     user_id: int | None = None,
     email: str | None = None,
     success: bool = True,
     reason: str | None = None,
+    logger: FilteringBoundLogger | None = None,
     **kwargs: Any,
 ) -> None:
     """
     Loga eventos de autenticação.
     """
+    logger = logger or _app_logger
+    if not logger.is_enabled_for(logging.INFO if success else logging.WARNING):
+        return
+
     log_data = {
         "event_category": "auth_event",
         "event_type": event_type,
@@ -184,25 +321,29 @@ def log_auth_event(
         log_data["reason"] = reason
 
     if success:
-        logger.info(f"Authentication event: {event_type}", **log_data)
+        logger.info("auth_event", **log_data)
     else:
-        logger.warning(f"Authentication failed: {event_type}", **log_data)
+        logger.warning("auth_event_failed", **log_data)
 
 
 def log_database_operation(
-    logger: structlog.BoundLogger,
     operation: str,
     table: str,
     success: bool = True,
     duration_ms: float | None = None,
     record_id: int | None = None,
+    logger: FilteringBoundLogger | None = None,
     **kwargs: Any,
 ) -> None:
     """
     Loga operações de banco de dados.
     """
+    logger = logger or _app_logger
+    if not logger.is_enabled_for(logging.DEBUG if success else logging.ERROR):
+        return
+
     log_data = {
-        "event": "database_operation",
+        "event_category": "database_operation",
         "operation": operation,
         "table": table,
         "success": success,
@@ -215,8 +356,30 @@ def log_database_operation(
         log_data["record_id"] = record_id
 
     if success:
-        logger.debug(f"Database operation: {operation} on {table}", **log_data)
+        logger.debug("db_operation", **log_data)
     else:
-        logger.error(f"Database operation failed: {operation} on {table}", **log_data)
+        logger.error("db_operation_failed", **log_data)
+
+
+def log_database_operation_lazy(
+    operation: str,
+    table: str,
+    context: Callable[[], dict[str, Any]],
+    success: bool = True,
+    logger: FilteringBoundLogger | None = None,
+) -> None:
+    """
+    Variante de log_database_operation cujo contexto só é montado se o
+    evento for de fato emitido.
+    """
+    logger = logger or _app_logger
+    if not logger.is_enabled_for(logging.DEBUG if success else logging.ERROR):
+        return
+
+    log_database_operation(
+        operation, table, success=success, logger=logger, **context()
+    )
+
 
 logger = setup_logging()
+_app_logger: FilteringBoundLogger = structlog.get_logger("demeter")
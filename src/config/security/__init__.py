@@ -6,11 +6,14 @@ from src.config.security.auth import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    inspect_token,
     verify_token,
 )
 from src.config.security.password import (
     get_password_hash,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     validate_password_strength,
 )
 
@@ -18,8 +21,11 @@ __all__ = [
     "create_access_token",
     "create_refresh_token",
     "decode_token",
+    "inspect_token",
     "verify_token",
     "get_password_hash",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
     "validate_password_strength",
 ]
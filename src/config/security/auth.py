@@ -5,14 +5,25 @@ Este módulo implementa a criação, verificação e decodificação de tokens J
 para autenticação de usuários na API.
 """
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from jose import JWTError, jwt
-from jose.exceptions import ExpiredSignatureError
+import jwt
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
 from src.config.settings import settings
 
+_SECRET_KEY = settings.SECRET_KEY
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [settings.ALGORITHM]
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+_token_cache: "OrderedDict[Tuple[bytes, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 
 def create_access_token(
     subject: str | int,
@@ -21,14 +32,12 @@ def create_access_token(
     """
     Cria um access token JWT.
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+    now = datetime.now(timezone.utc)
 
     to_encode: Dict[str, Any] = {
         "sub": str(subject),
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _ACCESS_TOKEN_TTL,
+        "iat": now,
         "type": "access",
     }
 
@@ -37,8 +46,8 @@ def create_access_token(
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
+        _SECRET_KEY,
+        algorithm=_ALGORITHM,
     )
 
     return encoded_jwt
@@ -48,21 +57,19 @@ def create_refresh_token(subject: str | int) -> str:
     """
     Cria um refresh token JWT.
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-    )
+    now = datetime.now(timezone.utc)
 
     to_encode: Dict[str, Any] = {
         "sub": str(subject),
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _REFRESH_TOKEN_TTL,
+        "iat": now,
         "type": "refresh",
     }
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
+        _SECRET_KEY,
+        algorithm=_ALGORITHM,
     )
 
     return encoded_jwt
@@ -75,13 +82,13 @@ def decode_token(token: str) -> Dict[str, Any]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+            _SECRET_KEY,
+            algorithms=_ALGORITHMS,
             options={"verify_exp": False},  # Não verifica expiração
         )
         return payload
-    except JWTError as e:
-        raise JWTError(f"Token inválido: {str(e)}")
+    except InvalidTokenError as e:
+        raise InvalidTokenError(f"Token inválido: {str(e)}")
 
 
 def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
@@ -91,8 +98,8 @@ def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+            _SECRET_KEY,
+            algorithms=_ALGORITHMS,
         )
 
         if payload.get("type") != token_type:
@@ -105,45 +112,86 @@ def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
 
     except ExpiredSignatureError:
         raise ExpiredSignatureError("Token expirado")
-    except JWTError as e:
-        raise JWTError(f"Token inválido: {str(e)}")
+    except InvalidTokenError as e:
+        raise InvalidTokenError(f"Token inválido: {str(e)}")
 
 
-def get_token_expiration(token: str) -> Optional[datetime]:
+def verify_token_cached(token: str, token_type: str = "access") -> Dict[str, Any]:
     """
-    Retorna a data de expiração de um token.
+    Versão de verify_token com cache TTL dos payloads já verificados.
+
+    A chave é o digest blake2b de 128 bits do token (nunca o token em si).
+    A entrada expira no menor valor entre JWT_CACHE_TTL_SECONDS e o "exp" do
+    token; tokens inválidos ou expirados não são guardados.
+    """
+    ttl = settings.JWT_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return verify_token(token, token_type)
+
+    key = (hashlib.blake2b(token.encode(), digest_size=16).digest(), token_type)
+    now = time.monotonic()
+
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > now:
+            _token_cache.move_to_end(key)
+            return dict(payload)
+        del _token_cache[key]
+
+    payload = verify_token(token, token_type)
+
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        _token_cache[key] = (now + min(ttl, remaining), payload)
+        if len(_token_cache) > settings.JWT_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+    return dict(payload)
+
+
+def inspect_token(token: str) -> Tuple[Optional[int], Optional[datetime], bool]:
+    """
+    Decodifica o token uma única vez e retorna (user_id, expiração, expirado).
+
+    Tokens inválidos resultam em (None, None, True).
     """
     try:
         payload = decode_token(token)
-        exp_timestamp = payload.get("exp")
+    except InvalidTokenError:
+        return None, None, True
 
-        if exp_timestamp:
-            return datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
+    try:
+        sub = payload.get("sub")
+        user_id = int(sub) if sub else None
+    except (ValueError, TypeError):
+        user_id = None
+
+    exp_timestamp = payload.get("exp")
+    expiration = (
+        datetime.fromtimestamp(exp_timestamp, tz=timezone.utc) if exp_timestamp else None
+    )
+    expired = expiration is None or datetime.now(timezone.utc) > expiration
 
-        return None
-    except JWTError:
-        return None
+    return user_id, expiration, expired
 
 
-def is_token_expired(token: str) -> bool:
+def get_token_expiration(token: str) -> Optional[datetime]:
     """
-    Verifica se um token está expirado.
+    Retorna a data de expiração de um token.
     """
-    expiration = get_token_expiration(token)
+    return inspect_token(token)[1]
 
-    if expiration is None:
-        return True
 
-    return datetime.now(timezone.utc) > expiration
+def is_token_expired(token: str) -> bool:
+    """
+    Verifica se um token está expirado.
+    """
+    return inspect_token(token)[2]
 
 
 def extract_user_id_from_token(token: str) -> Optional[int]:
     """
     Extrai o user_id de um token JWT.
     """
-    try:
-        payload = decode_token(token)
-        user_id = payload.get("sub")
-        return int(user_id) if user_id else None
-    except (JWTError, ValueError, TypeError):
-        return None
+    return inspect_token(token)[0]
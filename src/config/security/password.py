@@ -2,54 +2,321 @@
 Módulo responsável por hashing e verificação de senhas usando Argon2id.
 """
 
-import re
+import asyncio
+import hashlib
+import json
+import os
+import platform
+import string
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Tuple
 
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
+from src.config.logging.logger import get_logger
 from src.config.settings import settings
 
-pwd_context = CryptContext(
-    schemes=["argon2"],
-    deprecated="auto",
-    argon2__memory_cost=65536,
-    argon2__time_cost=2,
-    argon2__parallelism=4,
+logger = get_logger(__name__)
+
+_ARGON2_MAX_MEMORY_COST = 262144  # 256 MiB
+_ARGON2_MAX_TIME_COST = 10
+_ARGON2_PARAMS_FILE = Path(settings.LOG_DIR) / "argon2_params.json"
+
+
+def _available_memory_bytes() -> int | None:
+    """
+    Memória disponível para o processo: a livre no sistema, limitada pelo
+    memory.max do cgroup (containers), quando houver.
+    """
+    try:
+        available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+    try:
+        limit = Path("/sys/fs/cgroup/memory.max").read_text().strip()
+    except OSError:
+        limit = "max"
+    if limit.isdigit():
+        available = min(available, int(limit))
+
+    return available
+
+
+def _argon2_memory_cap() -> int:
+    """
+    Teto de memory_cost (KiB) para a calibração.
+
+    Metade da memória disponível, dividida entre todos os hashes que podem
+    rodar ao mesmo tempo (WEB_CONCURRENCY x MAX_CONCURRENT_PASSWORD_HASHES),
+    e nunca acima de _ARGON2_MAX_MEMORY_COST.
+    """
+    available = _available_memory_bytes()
+    if available is None:
+        return _ARGON2_MAX_MEMORY_COST
+
+    concurrent = settings.WEB_CONCURRENCY * settings.MAX_CONCURRENT_PASSWORD_HASHES
+    return min(_ARGON2_MAX_MEMORY_COST, available // 2 // 1024 // concurrent)
+
+
+def _calibrate_argon2(target_ms: int, max_memory_cost: int) -> Tuple[int, int]:
+    """
+    Dobra a memória (até max_memory_cost) e depois soma iterações até o hash
+    levar ~target_ms.
+
+    Parte de ARGON2_MEMORY_COST e ARGON2_TIME_COST e nunca devolve valores
+    abaixo dos configurados.
+    """
+    memory_cost, time_cost = settings.ARGON2_MEMORY_COST, settings.ARGON2_TIME_COST
+    while True:
+        hasher = PasswordHasher(
+            memory_cost=memory_cost,
+            time_cost=time_cost,
+            parallelism=settings.ARGON2_PARALLELISM,
+        )
+        start = time.perf_counter()
+        hasher.hash("x" * 16)
+        if (time.perf_counter() - start) * 1000 >= target_ms:
+            return memory_cost, time_cost
+
+        if memory_cost * 2 <= max_memory_cost:
+            memory_cost *= 2
+        elif time_cost < _ARGON2_MAX_TIME_COST:
+            time_cost += 1
+        else:
+            return memory_cost, time_cost
+
+
+def _save_argon2_parameters(cached: dict) -> None:
+    """
+    Grava o cache de parâmetros de forma atômica (arquivo temporário +
+    os.replace), já que vários workers podem calibrar ao mesmo tempo.
+    """
+    _ARGON2_PARAMS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = _ARGON2_PARAMS_FILE.with_name(
+        f"{_ARGON2_PARAMS_FILE.name}.{os.getpid()}.tmp"
+    )
+    tmp_file.write_text(json.dumps(cached))
+    os.replace(tmp_file, _ARGON2_PARAMS_FILE)
+
+
+def _argon2_parameters() -> Tuple[int, int]:
+    """
+    Retorna (memory_cost, time_cost), calibrados para PASSWORD_HASH_TARGET_MS.
+
+    O resultado fica em cache em disco por máquina, para que a calibração
+    rode uma única vez. Em testes, ou com alvo 0, usa os valores configurados.
+    """
+    target_ms = settings.PASSWORD_HASH_TARGET_MS
+    if target_ms <= 0 or settings.ENVIRONMENT == "test":
+        return settings.ARGON2_MEMORY_COST, settings.ARGON2_TIME_COST
+
+    # Só os degraus alcançáveis pela dobra entram na chave, para que variações
+    # pequenas da memória livre não forcem nova calibração
+    max_memory_cost = settings.ARGON2_MEMORY_COST
+    while max_memory_cost * 2 <= _argon2_memory_cap():
+        max_memory_cost *= 2
+
+    key = "|".join(
+        map(
+            str,
+            (
+                platform.machine(),
+                platform.processor(),
+                os.cpu_count(),
+                settings.ARGON2_MEMORY_COST,
+                settings.ARGON2_TIME_COST,
+                settings.ARGON2_PARALLELISM,
+                max_memory_cost,
+                target_ms,
+            ),
+        )
+    )
+
+    try:
+        cached = json.loads(_ARGON2_PARAMS_FILE.read_text())
+    except (OSError, ValueError):
+        cached = {}
+
+    params = cached.get(key)
+    if params is None:
+        params = _calibrate_argon2(target_ms, max_memory_cost)
+        cached[key] = params
+        try:
+            _save_argon2_parameters(cached)
+        except OSError:
+            pass
+        logger.info(
+            "Argon2 parameters calibrated",
+            memory_cost=params[0],
+            time_cost=params[1],
+            target_ms=target_ms,
+        )
+
+    return params[0], params[1]
+
+
+_password_hasher: PasswordHasher | None = None
+_password_hasher_lock = threading.Lock()
+
+# Cada hash aloca memory_cost KiB; o semáforo limita quantos rodam ao mesmo
+# tempo, independente do tamanho do executor do asyncio.to_thread
+_kdf_semaphore = threading.BoundedSemaphore(settings.MAX_CONCURRENT_PASSWORD_HASHES)
+
+
+def get_password_hasher() -> PasswordHasher:
+    """
+    Retorna o PasswordHasher, calibrando-o no primeiro uso.
+
+    O lifespan da aplicação chama esta função na inicialização, para que a
+    calibração não recaia sobre o primeiro login.
+    """
+    global _password_hasher
+    if _password_hasher is None:
+        with _password_hasher_lock:
+            if _password_hasher is None:
+                memory_cost, time_cost = _argon2_parameters()
+                _password_hasher = PasswordHasher(
+                    memory_cost=memory_cost,
+                    time_cost=time_cost,
+                    parallelism=settings.ARGON2_PARALLELISM,
+                )
+    return _password_hasher
+
+
+_STRENGTH_CACHE_SIZE = 1024
+_UPPERCASE_BIT = 1
+_LOWERCASE_BIT = 2
+_DIGIT_BIT = 4
+_SPECIAL_BIT = 8
+
+
+def _build_class_table() -> bytes:
+    """
+    Tabela de 256 bytes que mapeia cada byte ASCII ao bit da sua classe.
+    """
+    table = bytearray(256)
+    for chars, bit in (
+        (string.ascii_uppercase, _UPPERCASE_BIT),
+        (string.ascii_lowercase, _LOWERCASE_BIT),
+        (string.digits, _DIGIT_BIT),
+        ('!@#$%^&*(),.?":{}|<>', _SPECIAL_BIT),
+    ):
+        for char in chars:
+            table[ord(char)] = bit
+    return bytes(table)
+
+
+_CLASS_TABLE = _build_class_table()
+_REQUIRED_CLASSES = tuple(
+    (bit, message)
+    for required, bit, message in (
+        (
+            settings.PASSWORD_REQUIRE_UPPERCASE,
+            _UPPERCASE_BIT,
+            "A senha deve conter ao menos uma letra maiúscula",
+        ),
+        (
+            settings.PASSWORD_REQUIRE_LOWERCASE,
+            _LOWERCASE_BIT,
+            "A senha deve conter ao menos uma letra minúscula",
+        ),
+        (
+            settings.PASSWORD_REQUIRE_DIGIT,
+            _DIGIT_BIT,
+            "A senha deve conter ao menos um número",
+        ),
+        (
+            settings.PASSWORD_REQUIRE_SPECIAL,
+            _SPECIAL_BIT,
+            "A senha deve conter ao menos um caractere especial (!@#$%^&*(),.?\":{}|<>)",
+        ),
+    )
+    if required
 )
+_strength_cache: "OrderedDict[bytes, Tuple[bool, str]]" = OrderedDict()
 
 
 def get_password_hash(password: str) -> str:
     """
     Gera hash de senha usando Argon2id.
     """
-    return pwd_context.hash(password)
+    hasher = get_password_hasher()
+    with _kdf_semaphore:
+        return hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifica se a senha em texto plano corresponde ao hash.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    hasher = get_password_hasher()
+    try:
+        with _kdf_semaphore:
+            return hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Gera o hash Argon2id em uma thread, sem bloquear o event loop.
+    """
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifica a senha em uma thread, sem bloquear o event loop.
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
 
 
 def validate_password_strength(password: str) -> Tuple[bool, str]:
     """
     Valida a força da senha com base nas configurações definidas.
+
+    O resultado é guardado em um cache LRU indexado pelo digest blake2b da
+    senha, nunca pelo texto plano.
+    """
+    key = hashlib.blake2b(password.encode(), digest_size=16).digest()
+
+    result = _strength_cache.get(key)
+    if result is not None:
+        _strength_cache.move_to_end(key)
+        return result
+
+    result = _check_password_strength(password)
+    _strength_cache[key] = result
+    if len(_strength_cache) > _STRENGTH_CACHE_SIZE:
+        _strength_cache.popitem(last=False)
+
+    return result
+
+
+def _check_password_strength(password: str) -> Tuple[bool, str]:
+    """
+    Executa as verificações de força da senha.
     """
     if len(password) < settings.PASSWORD_MIN_LENGTH:
         return False, f"A senha deve ter no mínimo {settings.PASSWORD_MIN_LENGTH} caracteres"
 
-    if settings.PASSWORD_REQUIRE_UPPERCASE and not re.search(r"[A-Z]", password):
-        return False, "A senha deve conter ao menos uma letra maiúscula"
-
-    if settings.PASSWORD_REQUIRE_LOWERCASE and not re.search(r"[a-z]", password):
-        return False, "A senha deve conter ao menos uma letra minúscula"
+    # translate classifica todos os bytes em C; restam no máximo 5 valores
+    mask = 0
+    for bit in set(password.encode().translate(_CLASS_TABLE)):
+        mask |= bit
 
-    if settings.PASSWORD_REQUIRE_DIGIT and not re.search(r"\d", password):
-        return False, "A senha deve conter ao menos um número"
+    # \d também aceitava dígitos Unicode, fora da tabela ASCII
+    if not password.isascii() and any(map(str.isdecimal, password)):
+        mask |= _DIGIT_BIT
 
-    if settings.PASSWORD_REQUIRE_SPECIAL and not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
-        return False, "A senha deve conter ao menos um caractere especial (!@#$%^&*(),.?\":{}|<>)"
+    for bit, message in _REQUIRED_CLASSES:
+        if not mask & bit:
+            return False, message
 
     return True, ""
 
@@ -58,4 +325,4 @@ def needs_rehash(hashed_password: str) -> bool:
     """
     Verifica se o hash precisa ser atualizado.
     """
-    return pwd_context.needs_update(hashed_password)
+    return get_password_hasher().check_needs_rehash(hashed_password)
@@ -1,9 +1,17 @@
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _split_csv(v):
+    """Converte string separada por vírgula em frozenset"""
+    if isinstance(v, str):
+        return frozenset(item.strip() for item in v.split(","))
+    return frozenset(v)
+
+
 class Settings(BaseSettings):
     """
     configurações centrais da API.
@@ -13,7 +21,8 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        frozen=True,
     )
 
     PROJECT_NAME: str = "DEMETER-API"
@@ -21,7 +30,7 @@ class Settings(BaseSettings):
     DESCRIPTION: str = "API para classificaçãoo de grãos com IA"
     API_V1_STR: str = "/api/v1"
 
-    ENVIRONMENT: Literal["development", "staging", "production"] = "development"
+    ENVIRONMENT: Literal["development", "staging", "production", "test"] = "development"
     DEBUG: bool = Field(default=True)
 
     DATABASE_URL: PostgresDsn = Field(
@@ -48,6 +57,28 @@ class Settings(BaseSettings):
         description="Máximo de conexões extras além do pool"
     )
 
+    DATABASE_POOL_TIMEOUT: int = Field(
+        default=30,
+        ge=1,
+        description="Segundos de espera por uma conexão livre no pool"
+    )
+
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800,
+        ge=-1,
+        description="Idade máxima (s) de uma conexão antes de ser reciclada (-1 desativa)"
+    )
+
+    DATABASE_USE_NULL_POOL: bool = Field(
+        default=False,
+        description="Usar NullPool (sem reaproveitar conexões), útil em testes"
+    )
+
+    DATABASE_PGBOUNCER: bool = Field(
+        default=False,
+        description="Desativar cache de prepared statements (PgBouncer em modo transaction)"
+    )
+
     @field_validator("DATABASE_ECHO")
     @classmethod
     def validate_database_echo(cls, v: bool, info) -> bool:
@@ -81,6 +112,64 @@ class Settings(BaseSettings):
         description="Tempo de expiração do refresh token em dias"
     )
 
+    JWT_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        ge=0,
+        le=300,
+        description="Tempo máximo (s) que um token verificado fica em cache (0 desativa)"
+    )
+
+    JWT_CACHE_MAXSIZE: int = Field(
+        default=10_000,
+        ge=1,
+        description="Número máximo de tokens verificados em cache"
+    )
+
+    USER_PERMISSIONS_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        ge=0,
+        le=600,
+        description="Tempo (s) que roles e permissions do usuário ficam em cache (0 desativa)"
+    )
+
+    ARGON2_MEMORY_COST: int = Field(
+        default=65536,
+        ge=8,
+        description="Memória (KiB) usada pelo Argon2id em cada hash"
+    )
+
+    ARGON2_TIME_COST: int = Field(
+        default=2,
+        ge=1,
+        description="Número de iterações do Argon2id"
+    )
+
+    ARGON2_PARALLELISM: int = Field(
+        default=4,
+        ge=1,
+        description="Número de lanes paralelas do Argon2id"
+    )
+
+    PASSWORD_HASH_TARGET_MS: int = Field(
+        default=250,
+        ge=0,
+        le=2000,
+        description="Tempo alvo (ms) do hash Argon2id para a calibração automática (0 desativa)"
+    )
+
+    MAX_CONCURRENT_PASSWORD_HASHES: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Máximo de hashes Argon2id simultâneos por worker (limita o uso de memória)"
+    )
+
+    WEB_CONCURRENCY: int = Field(
+        default=1,
+        ge=1,
+        description="Número de workers do servidor (a mesma variável lida pelo uvicorn)"
+    )
+
     PASSWORD_MIN_LENGTH: int = Field(
         default=8,
         ge=8,
@@ -107,45 +196,21 @@ class Settings(BaseSettings):
         description="Exigir caractere especial na senha"
     )
 
-    ALLOWED_ORIGINS: list[str] | str = Field(
-        default=["http://localhost:3000"],
+    ALLOWED_ORIGINS: frozenset[str] | str = Field(
+        default=frozenset({"http://localhost:3000"}),
         description="Lista de origens permitidas para CORS"
     )
 
-    @field_validator("ALLOWED_ORIGINS", mode="before")
-    @classmethod
-    def parse_allowed_origins(cls, v):
-        """Converte string separada por vírgula em lista"""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
-
-    ALLOWED_METHODS: list[str] | str = Field(
-        default=["GET", "POST", "PATCH", "DELETE"],
+    ALLOWED_METHODS: frozenset[str] | str = Field(
+        default=frozenset({"GET", "POST", "PATCH", "DELETE"}),
         description="Motodos HTTP permitidos"
     )
 
-    @field_validator("ALLOWED_METHODS", mode="before")
-    @classmethod
-    def parse_allowed_methods(cls, v):
-        """Converte string separada por vírgula em lista"""
-        if isinstance(v, str):
-            return [method.strip() for method in v.split(",")]
-        return v
-
-    ALLOWED_HEADERS: list[str] | str = Field(
-        default=["Authorization", "Content-Type"],
+    ALLOWED_HEADERS: frozenset[str] | str = Field(
+        default=frozenset({"Authorization", "Content-Type"}),
         description="Headers permitidos"
     )
 
-    @field_validator("ALLOWED_HEADERS", mode="before")
-    @classmethod
-    def parse_allowed_headers(cls, v):
-        """Converte string separada por vírgula em lista"""
-        if isinstance(v, str):
-            return [header.strip() for header in v.split(",")]
-        return v
-
     ALLOW_CREDENTIALS: bool = Field(
         default=True,
         description="Permitir envio de cookies/credenciais"
@@ -186,18 +251,22 @@ class Settings(BaseSettings):
         description="Tamanho máximo de upload em bytes"
     )
 
-    ALLOWED_IMAGE_TYPES: list[str] | str = Field(
-        default=["image/jpeg", "image/png", "image/jpg"],
+    ALLOWED_IMAGE_TYPES: frozenset[str] | str = Field(
+        default=frozenset({"image/jpeg", "image/png", "image/jpg"}),
         description="Tipos de imagem permitidos"
     )
 
-    @field_validator("ALLOWED_IMAGE_TYPES", mode="before")
+    @field_validator(
+        "ALLOWED_ORIGINS",
+        "ALLOWED_METHODS",
+        "ALLOWED_HEADERS",
+        "ALLOWED_IMAGE_TYPES",
+        mode="before",
+    )
     @classmethod
-    def parse_allowed_image_types(cls, v):
-        """Converte string separada por vírgula em lista"""
-        if isinstance(v, str):
-            return [img_type.strip() for img_type in v.split(",")]
-        return v
+    def parse_csv_list(cls, v):
+        """Aplica _split_csv às listas configuráveis por variável de ambiente"""
+        return _split_csv(v)
 
     UPLOAD_DIR: str = Field(
         default="uploads",
@@ -251,6 +320,20 @@ class Settings(BaseSettings):
         description="Habilitar fallback para mock em caso de erro da API de ML"
     )
 
+    MAX_CONCURRENT_CLASSIFIES: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Máximo de classificações simultâneas no envio em lote"
+    )
+
+    MAX_BULK_CLASSIFY_FILES: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Máximo de imagens aceitas por envio em lote"
+    )
+
     @property
     def is_development(self) -> bool:
         """Verifica se está em ambiente de desenvolvimento"""
@@ -266,4 +349,20 @@ class Settings(BaseSettings):
         """Retorna a URL do banco como string"""
         return str(self.DATABASE_URL)
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Retorna a instância única de Settings, criada no primeiro uso.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    """
+    Mantém `from src.config.settings import settings` funcionando, adiando a
+    leitura do ambiente até o primeiro acesso.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
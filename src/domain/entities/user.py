@@ -2,13 +2,16 @@
 Entidade de domínio para User.
 """
 
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 import re
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
 
-@dataclass
+
+@dataclass(slots=True)
 class UserEntity:
     """
     Entidade de domínio representando um Usuário.
@@ -29,6 +32,22 @@ class UserEntity:
         """Valida os dados após inicialização."""
         self._validate()
 
+    @classmethod
+    def from_row(cls, **values: Any) -> "UserEntity":
+        """
+        Cria a entidade a partir de dados já persistidos, sem revalidar.
+
+        Campos opcionais omitidos recebem o valor padrão.
+        """
+        entity = cls.__new__(cls)
+        for field in fields(cls):
+            if field.default is MISSING:
+                value = values[field.name]
+            else:
+                value = values.get(field.name, field.default)
+            object.__setattr__(entity, field.name, value)
+        return entity
+
     def _validate(self) -> None:
         """
         Valida as regras de negócio da entidade.
@@ -39,8 +58,7 @@ class UserEntity:
         if not self.email:
             raise ValueError("Email é obrigatório")
 
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, self.email):
+        if not _EMAIL_RE.match(self.email):
             raise ValueError("Email inválido")
 
         if len(self.email) > 255:
@@ -61,7 +79,7 @@ class UserEntity:
         if not self.phone:
             raise ValueError("Telefone é obrigatório")
 
-        phone_digits = re.sub(r'\D', '', self.phone)
+        phone_digits = _NON_DIGIT_RE.sub('', self.phone)
 
         if len(phone_digits) < 10 or len(phone_digits) > 11:
             raise ValueError("Telefone deve ter 10 ou 11 dígitos")
@@ -2,17 +2,15 @@
 Interface do repositório de Refresh Tokens.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Protocol
 from datetime import datetime
 
 
-class RefreshTokenRepository(ABC):
+class RefreshTokenRepository(Protocol):
     """
-    Interface abstrata para repositório de Refresh Tokens.
+    Protocolo do repositório de Refresh Tokens.
     """
 
-    @abstractmethod
     async def create(
         self,
         token: str,
@@ -24,23 +22,20 @@ class RefreshTokenRepository(ABC):
         """
         Cria um novo refresh token.
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_token(self, token: str) -> Optional[dict]:
         """
         Busca um refresh token pelo hash.
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_id(self, token_id: int) -> Optional[dict]:
         """
         Busca um refresh token por ID.
         """
-        pass
+        ...
 
-    @abstractmethod
     async def list_by_user(
         self,
         user_id: int,
@@ -49,39 +44,34 @@ class RefreshTokenRepository(ABC):
         """
         Lista todos os refresh tokens de um usuário.
         """
-        pass
+        ...
 
-    @abstractmethod
     async def revoke(self, token: str) -> bool:
         """
         Revoga um refresh token.
         """
-        pass
+        ...
 
-    @abstractmethod
     async def revoke_all_by_user(self, user_id: int) -> int:
         """
         Revoga todos os refresh tokens de um usuário.
         """
-        pass
+        ...
 
-    @abstractmethod
     async def delete_expired(self) -> int:
         """
         Deleta todos os tokens expirados do banco de dados.
         """
-        pass
+        ...
 
-    @abstractmethod
     async def is_valid(self, token: str) -> bool:
         """
         Verifica se um token é válido (existe, não revogado, não expirado).
         """
-        pass
+        ...
 
-    @abstractmethod
     async def exists(self, token: str) -> bool:
         """
         Verifica se um token existe no banco.
         """
-        pass
+        ...
@@ -0,0 +1 @@
+"""Infrastructure caches."""
@@ -0,0 +1,57 @@
+"""
+Cache em memória do contexto de autorização (roles e permissions) do usuário.
+
+Fica fora de src.config.dependencies para que os use cases possam invalidá-lo
+sem depender do FastAPI.
+"""
+
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+_USER_PERMISSIONS_CACHE_SIZE = 5000
+_user_permissions_cache: "OrderedDict[int, Tuple[float, Mapping[str, Any]]]" = OrderedDict()
+
+
+def get_cached_user_permissions(user_id: int) -> Dict[str, Any] | None:
+    """
+    Retorna uma cópia do contexto em cache do usuário, ou None se ausente ou
+    expirado; a requisição pode alterá-la sem afetar as demais.
+    """
+    cached = _user_permissions_cache.get(user_id)
+    if cached is None:
+        return None
+    expires_at, current_user = cached
+    if expires_at > time.monotonic():
+        _user_permissions_cache.move_to_end(user_id)
+        return dict(current_user)
+    del _user_permissions_cache[user_id]
+    return None
+
+
+def cache_user_permissions(
+    user_id: int, current_user: Dict[str, Any], ttl: float
+) -> None:
+    """
+    Armazena uma cópia imutável do contexto do usuário por ttl segundos,
+    descartando o mais antigo.
+    """
+    _user_permissions_cache[user_id] = (
+        time.monotonic() + ttl,
+        MappingProxyType(dict(current_user)),
+    )
+    if len(_user_permissions_cache) > _USER_PERMISSIONS_CACHE_SIZE:
+        _user_permissions_cache.popitem(last=False)
+
+
+def invalidate_user_permissions_cache(user_id: int | None = None) -> None:
+    """
+    Remove o usuário do cache de permissões; sem argumento, limpa tudo.
+
+    Deve ser chamado após alterações de dados, status ou roles do usuário.
+    """
+    if user_id is None:
+        _user_permissions_cache.clear()
+    else:
+        _user_permissions_cache.pop(user_id, None)
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from decimal import Decimal
 
-from sqlalchemy import String, DateTime, ForeignKey, Boolean, Index, Numeric, JSON
+from sqlalchemy import String, DateTime, ForeignKey, Boolean, Index, Numeric, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.config.db.database import Base
@@ -85,6 +85,21 @@ class Classification(Base):
     __table_args__ = (
         Index("ix_classifications_user_is_deleted", "user_id", "is_deleted"),
         Index("ix_classifications_created_at_desc", "created_at"),
+        Index(
+            "ix_classifications_user_active_created",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_classifications_user_grain_active_created",
+            "user_id",
+            "grain_type",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_deleted = false"),
+        ),
     )
 
     def __repr__(self) -> str:
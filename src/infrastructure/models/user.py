@@ -5,7 +5,7 @@ Modelo SQLAlchemy para a tabela de Usuários.
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import String, Boolean, DateTime, Index, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, Index, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.config.db.database import Base
@@ -69,6 +69,7 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
         comment="Data de criação da conta",
     )
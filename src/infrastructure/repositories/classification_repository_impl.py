@@ -1,21 +1,57 @@
 """Implementação do repositório de Classifications."""
 
+import json
 from typing import Optional
 from datetime import datetime, timezone
-from sqlalchemy import select, func, and_
+from asyncpg.exceptions import IntegrityConstraintViolationError
+from sqlalchemy import JSON, Text, select, func, and_, cast, insert, literal, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.models.classification import Classification
-from src.config.exceptions.custom_exceptions import DatabaseError, NotFoundError
+from src.config.exceptions.custom_exceptions import DatabaseError, NotFoundError, ValidationError
 from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+_COPY_THRESHOLD = 100
+_COPY_COLUMNS = [
+    "user_id",
+    "image_path",
+    "grain_type",
+    "confidence_score",
+    "extra_data",
+    "is_deleted",
+    "created_at",
+    "updated_at",
+]
+
 
 class ClassificationRepositoryImpl:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _build_filters(
+        user_id: Optional[int],
+        include_deleted: bool,
+        grain_type: Optional[str],
+    ) -> list:
+        """Monta as condições de filtro usadas na listagem e contagem."""
+        conditions = []
+
+        if user_id is not None:
+            conditions.append(Classification.user_id == user_id)
+
+        if not include_deleted:
+            conditions.append(Classification.is_deleted == False)
+
+        if grain_type:
+            conditions.append(Classification.grain_type == grain_type)
+
+        return conditions
+
     async def create(
         self,
         user_id: int,
@@ -44,6 +80,70 @@ class ClassificationRepositoryImpl:
             logger.error("Error creating classification", user_id=user_id, error=str(e))
             raise DatabaseError(f"Erro ao criar classificação: {str(e)}")
 
+    async def create_bulk(self, rows: list[dict]) -> int:
+        """
+        Insere várias classificações de uma vez.
+
+        Acima de _COPY_THRESHOLD linhas usa COPY do asyncpg na conexão da
+        sessão, dentro da mesma transação; abaixo disso, um INSERT multi-valores.
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now(timezone.utc)
+
+        try:
+            if len(rows) <= _COPY_THRESHOLD:
+                await self.session.execute(
+                    insert(Classification),
+                    [
+                        {
+                            "user_id": r["user_id"],
+                            "image_path": r["image_path"],
+                            "grain_type": r["grain_type"],
+                            "confidence_score": r.get("confidence_score"),
+                            "extra_data": r.get("extra_data"),
+                        }
+                        for r in rows
+                    ],
+                )
+            else:
+                conn = await self.session.connection()
+                raw = (await conn.get_raw_connection()).driver_connection
+                records = [
+                    (
+                        r["user_id"],
+                        r["image_path"],
+                        r["grain_type"],
+                        r.get("confidence_score"),
+                        json.dumps(r["extra_data"]) if r.get("extra_data") is not None else None,
+                        False,
+                        now,
+                        now,
+                    )
+                    for r in rows
+                ]
+                await raw.copy_records_to_table(
+                    Classification.__tablename__,
+                    records=records,
+                    columns=_COPY_COLUMNS,
+                )
+
+            logger.info("Classifications bulk created", count=len(rows))
+            return len(rows)
+        except (IntegrityError, IntegrityConstraintViolationError) as e:
+            # user_id inexistente (FK) é erro do lote enviado, não do servidor;
+            # o COPY levanta a exceção do asyncpg diretamente
+            await self.session.rollback()
+            logger.warning("Classifications import rejected", count=len(rows), error=str(e))
+            raise ValidationError(
+                "Lote de importação inválido: verifique se todos os user_id existem"
+            )
+        except Exception as e:
+            await self.session.rollback()
+            logger.error("Error bulk creating classifications", count=len(rows), error=str(e))
+            raise DatabaseError(f"Erro ao importar classificações: {str(e)}")
+
     async def get_by_id(
         self,
         classification_id: int,
@@ -77,29 +177,65 @@ class ClassificationRepositoryImpl:
     ) -> list[Classification]:
         """Lista classificações com filtros opcionais."""
         try:
-            conditions = []
+            conditions = self._build_filters(user_id, include_deleted, grain_type)
 
-            if user_id is not None:
-                conditions.append(Classification.user_id == user_id)
+            stmt = select(Classification)
+            if conditions:
+                stmt = stmt.where(and_(*conditions))
 
-            if not include_deleted:
-                conditions.append(Classification.is_deleted == False)
+            stmt = (
+                stmt.order_by(Classification.created_at.desc(), Classification.id.desc())
+                .offset(skip)
+                .limit(limit)
+            )
 
-            if grain_type:
-                conditions.append(Classification.grain_type == grain_type)
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+        except Exception as e:
+            logger.error("Error listing classifications", error=str(e))
+            raise DatabaseError(f"Erro ao listar classificações: {str(e)}")
 
-            stmt = select(Classification)
+    async def list_with_total(
+        self,
+        user_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+        include_deleted: bool = False,
+        grain_type: Optional[str] = None,
+    ) -> tuple[list[Classification], int]:
+        """Lista classificações e retorna o total filtrado na mesma consulta."""
+        try:
+            conditions = self._build_filters(user_id, include_deleted, grain_type)
+
+            stmt = select(Classification, func.count().over().label("total"))
             if conditions:
                 stmt = stmt.where(and_(*conditions))
 
-            stmt = stmt.order_by(Classification.created_at.desc()).offset(skip).limit(limit)
+            stmt = (
+                stmt.order_by(Classification.created_at.desc(), Classification.id.desc())
+                .offset(skip)
+                .limit(limit)
+            )
 
             result = await self.session.execute(stmt)
-            return list(result.scalars().all())
+            rows = result.all()
         except Exception as e:
             logger.error("Error listing classifications", error=str(e))
             raise DatabaseError(f"Erro ao listar classificações: {str(e)}")
 
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        if skip == 0:
+            return [], 0
+
+        # Página além do fim não traz linhas, então o total vem da contagem
+        return [], await self.count(
+            user_id=user_id,
+            include_deleted=include_deleted,
+            grain_type=grain_type,
+        )
+
     async def count(
         self,
         user_id: Optional[int] = None,
@@ -108,16 +244,7 @@ class ClassificationRepositoryImpl:
     ) -> int:
         """Conta classificações com filtros opcionais."""
         try:
-            conditions = []
-
-            if user_id is not None:
-                conditions.append(Classification.user_id == user_id)
-
-            if not include_deleted:
-                conditions.append(Classification.is_deleted == False)
-
-            if grain_type:
-                conditions.append(Classification.grain_type == grain_type)
+            conditions = self._build_filters(user_id, include_deleted, grain_type)
 
             stmt = select(func.count(Classification.id))
             if conditions:
@@ -141,6 +268,43 @@ class ClassificationRepositoryImpl:
             logger.error("Error updating classification", classification_id=classification.id, error=str(e))
             raise DatabaseError(f"Erro ao atualizar classificação: {str(e)}")
 
+    async def patch_notes(
+        self,
+        classification_id: int,
+        user_id: int,
+        notes: str,
+    ) -> Optional[Classification]:
+        """Grava as notas em extra_data com um único UPDATE ... RETURNING."""
+        try:
+            extra_data = func.coalesce(cast(Classification.extra_data, JSONB), cast(literal("{}"), JSONB))
+            notes_path = literal(["notes"], ARRAY(Text))
+            stmt = (
+                update(Classification)
+                .where(
+                    Classification.id == classification_id,
+                    Classification.user_id == user_id,
+                    Classification.is_deleted == False,
+                )
+                .values(
+                    extra_data=cast(
+                        func.jsonb_set(extra_data, notes_path, func.to_jsonb(cast(literal(notes), Text))),
+                        JSON,
+                    )
+                )
+                .returning(Classification)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            classification = result.scalar_one_or_none()
+        except Exception as e:
+            await self.session.rollback()
+            logger.error("Error updating classification notes", classification_id=classification_id, error=str(e))
+            raise DatabaseError(f"Erro ao atualizar classificação: {str(e)}")
+
+        if classification is not None:
+            logger.info("Classification updated", classification_id=classification_id)
+        return classification
+
     async def soft_delete(self, classification_id: int, user_id: Optional[int] = None) -> bool:
         """Soft delete de uma classificação."""
         classification = await self.get_by_id(classification_id, user_id=user_id)
@@ -175,21 +339,21 @@ class ClassificationRepositoryImpl:
             logger.error("Error hard deleting classification", classification_id=classification_id, error=str(e))
             raise DatabaseError(f"Erro ao deletar classificação: {str(e)}")
 
-    async def restore(self, classification_id: int) -> bool:
-        """Restaura uma classificação soft deleted."""
+    async def restore(self, classification_id: int) -> Classification:
+        """Restaura uma classificação soft deleted e a retorna."""
         classification = await self.get_by_id(classification_id, include_deleted=True)
 
         if not classification:
             raise NotFoundError("Classificação não encontrada")
 
         if not classification.is_deleted:
-            return True
+            return classification
 
         try:
             classification.restore()
             await self.session.flush()
             logger.info("Classification restored", classification_id=classification_id)
-            return True
+            return classification
         except Exception as e:
             await self.session.rollback()
             logger.error("Error restoring classification", classification_id=classification_id, error=str(e))
@@ -9,7 +9,6 @@ from sqlalchemy import select, delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
-from src.domain.repositories.refresh_token_repository import RefreshTokenRepository
 from src.infrastructure.models.refresh_token import RefreshToken
 from src.config.exceptions.custom_exceptions import (
     NotFoundError,
@@ -20,7 +19,7 @@ from src.config.logging.logger import get_logger
 logger = get_logger(__name__)
 
 
-class RefreshTokenRepositoryImpl(RefreshTokenRepository):
+class RefreshTokenRepositoryImpl:
     """
     Implementação do repositório de Refresh Tokens usando SQLAlchemy.
 
@@ -1,5 +1,6 @@
 """Implementação do repositório de Roles."""
 
+import asyncio
 from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,11 +13,45 @@ from src.config.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Roles são dados de sistema imutáveis; o id é cacheado por nome no processo.
+_role_id_cache: dict[str, int] = {}
+_role_id_lock = asyncio.Lock()
+
+
+def clear_role_id_cache() -> None:
+    """Limpa o cache de ids de roles (usado após o seed)."""
+    _role_id_cache.clear()
+
 
 class RoleRepositoryImpl:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def get_id_by_name(self, name: str) -> Optional[int]:
+        """Retorna o id da role pelo nome, usando cache em memória."""
+        role_id = _role_id_cache.get(name)
+        if role_id is not None:
+            return role_id
+
+        async with _role_id_lock:
+            role_id = _role_id_cache.get(name)
+            if role_id is not None:
+                return role_id
+
+            try:
+                stmt = select(Role.id).where(Role.name == name).limit(1)
+                result = await self.session.execute(stmt)
+                role_id = result.scalar_one_or_none()
+            except Exception as e:
+                logger.error("Error fetching role id by name", name=name, error=str(e))
+                raise DatabaseError(f"Erro ao buscar role: {str(e)}")
+
+            if role_id is None:
+                return None
+
+            _role_id_cache[name] = role_id
+            return role_id
+
     async def get_by_name(self, name: str) -> Optional[Role]:
         """Busca role por nome."""
         try:
@@ -66,7 +101,6 @@ class RoleRepositoryImpl:
             )
             self.session.add(user_role)
             await self.session.flush()
-            await self.session.refresh(user_role)
 
             logger.info("Role assigned to user", user_id=user_id, role_id=role_id)
             return user_role
@@ -5,12 +5,12 @@ Implementação concreta do repositório de Usuários usando SQLAlchemy.
 from typing import Optional, List
 from datetime import datetime
 
-from sqlalchemy import select, update as sql_update
+from sqlalchemy import and_, delete as sql_delete, distinct, exists, func, select, update as sql_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
-from src.domain.repositories.user_repository import UserRepository
 from src.domain.entities.user import UserEntity
 from src.infrastructure.models.user import User
 from src.infrastructure.models.user_role import UserRole
@@ -27,7 +27,7 @@ from src.config.logging.logger import get_logger
 logger = get_logger(__name__)
 
 
-class UserRepositoryImpl(UserRepository):
+class UserRepositoryImpl:
     """
     Implementação do repositório de Usuários usando SQLAlchemy.
 
@@ -40,7 +40,7 @@ class UserRepositoryImpl(UserRepository):
 
     def _model_to_entity(self, model: User) -> UserEntity:
         """Converte modelo SQLAlchemy para entidade de domínio."""
-        return UserEntity(
+        return UserEntity.from_row(
             id=model.id,
             email=model.email,
             name=model.name,
@@ -54,35 +54,53 @@ class UserRepositoryImpl(UserRepository):
         )
 
     async def create(self, user: UserEntity) -> UserEntity:
-        """Cria um novo usuário."""
+        """
+        Cria um novo usuário.
+
+        Usa INSERT ... ON CONFLICT DO NOTHING RETURNING, dispensando a
+        consulta prévia por email.
+        """
         try:
-            model = User(
-                email=user.email,
-                name=user.name,
-                phone=user.phone,
-                hashed_password=user.hashed_password,
-                is_active=user.is_active,
-                is_verified=user.is_verified,
+            stmt = (
+                pg_insert(User)
+                .values(
+                    email=user.email,
+                    name=user.name,
+                    phone=user.phone,
+                    hashed_password=user.hashed_password,
+                    is_active=user.is_active,
+                    is_verified=user.is_verified,
+                )
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(User.id, User.created_at, User.updated_at)
             )
+            result = await self.session.execute(stmt)
+            row = result.one_or_none()
 
-            self.session.add(model)
-            await self.session.flush()
-            await self.session.refresh(model)
-
-            logger.info("User created", user_id=model.id, email=model.email)
-            return self._model_to_entity(model)
-
-        except IntegrityError as e:
+        except Exception as e:
             await self.session.rollback()
+            logger.error("User creation failed", error=str(e), exc_info=True)
+            raise DatabaseError(f"Erro ao criar usuário: {str(e)}")
+
+        if row is None:
             logger.warning("User creation failed - duplicate email", email=user.email)
             raise ConflictError(
                 f"Usuário com email '{user.email}' já existe",
                 details={"email": user.email},
             )
-        except Exception as e:
-            await self.session.rollback()
-            logger.error("User creation failed", error=str(e), exc_info=True)
-            raise DatabaseError(f"Erro ao criar usuário: {str(e)}")
+
+        logger.info("User created", user_id=row.id, email=user.email)
+        return UserEntity.from_row(
+            id=row.id,
+            email=user.email,
+            name=user.name,
+            phone=user.phone,
+            hashed_password=user.hashed_password,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
 
     async def get_by_id(self, user_id: int) -> Optional[UserEntity]:
         """Busca um usuário por ID."""
@@ -171,6 +189,61 @@ class UserRepositoryImpl(UserRepository):
             logger.error("User update failed", user_id=user.id, error=str(e))
             raise DatabaseError(f"Erro ao atualizar usuário: {str(e)}")
 
+    async def update_with_conflict_check(self, user_id: int, values: dict) -> UserEntity:
+        """
+        Atualiza campos de um usuário com um único UPDATE ... RETURNING.
+
+        A cláusula WHERE valida a existência do usuário e, quando o email muda,
+        a ausência de outro usuário com o mesmo email. Só quando nenhuma linha
+        retorna é feita uma consulta extra para diferenciar NotFound de Conflict.
+        """
+        if not values:
+            user = await self.get_by_id(user_id)
+            if not user:
+                raise NotFoundError(f"Usuário com ID {user_id} não encontrado")
+            return user
+
+        email = values.get("email")
+
+        try:
+            condition = User.id == user_id
+            if email is not None:
+                other = aliased(User)
+                condition = and_(
+                    condition,
+                    ~exists().where(and_(other.email == email, other.id != user_id)),
+                )
+
+            stmt = (
+                sql_update(User)
+                .where(condition)
+                .values(**values)
+                .returning(User)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            model = result.scalar_one_or_none()
+
+            if model:
+                logger.info("User updated", user_id=model.id, email=model.email)
+                return self._model_to_entity(model)
+
+            found = await self.session.execute(
+                select(User.id).where(User.id == user_id).limit(1)
+            )
+
+        except IntegrityError:
+            await self.session.rollback()
+            raise ConflictError(f"Email '{email}' já está em uso")
+        except Exception as e:
+            await self.session.rollback()
+            logger.error("User update failed", user_id=user_id, error=str(e))
+            raise DatabaseError(f"Erro ao atualizar usuário: {str(e)}")
+
+        if found.scalar_one_or_none() is None:
+            raise NotFoundError(f"Usuário com ID {user_id} não encontrado")
+        raise ConflictError(f"Email '{email}' já está em uso")
+
     async def delete(self, user_id: int) -> bool:
         """Deleta um usuário."""
         try:
@@ -194,6 +267,26 @@ class UserRepositoryImpl(UserRepository):
             logger.error("User deletion failed", user_id=user_id, error=str(e))
             raise DatabaseError(f"Erro ao deletar usuário: {str(e)}")
 
+    async def delete_returning_email(self, user_id: int) -> Optional[str]:
+        """
+        Deleta um usuário com um único DELETE ... RETURNING.
+
+        Tokens, roles e classificações são removidos pelo ON DELETE CASCADE.
+        """
+        try:
+            stmt = sql_delete(User).where(User.id == user_id).returning(User.email)
+            result = await self.session.execute(stmt)
+            email = result.scalar_one_or_none()
+
+            if email is not None:
+                logger.info("User deleted", user_id=user_id)
+            return email
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error("User deletion failed", user_id=user_id, error=str(e))
+            raise DatabaseError(f"Erro ao deletar usuário: {str(e)}")
+
     async def exists_by_email(self, email: str) -> bool:
         """Verifica se existe um usuário com o email especificado."""
         try:
@@ -235,8 +328,6 @@ class UserRepositoryImpl(UserRepository):
     async def count_all(self, is_active: Optional[bool] = None) -> int:
         """Conta o número total de usuários."""
         try:
-            from sqlalchemy import func
-
             stmt = select(func.count(User.id))
 
             if is_active is not None:
@@ -324,6 +415,59 @@ class UserRepositoryImpl(UserRepository):
             logger.error("Error fetching user with roles", user_id=user_id, error=str(e))
             raise DatabaseError(f"Erro ao buscar usuário: {str(e)}")
 
+    async def get_auth_context(self, user_id: int, include_deleted: bool = False) -> Optional[dict]:
+        """
+        Busca dados do usuário com nomes de roles e permissions em uma única query.
+
+        O Postgres agrega os nomes distintos (array_agg DISTINCT), devolvendo
+        uma única linha por usuário, sem hidratar entidades ORM.
+        """
+        try:
+            stmt = (
+                select(
+                    User.id,
+                    User.email,
+                    User.name,
+                    User.is_active,
+                    User.is_deleted,
+                    func.array_agg(distinct(Role.name))
+                    .filter(Role.name.is_not(None))
+                    .label("roles"),
+                    func.array_agg(distinct(Permission.name))
+                    .filter(Permission.name.is_not(None))
+                    .label("permissions"),
+                )
+                .outerjoin(UserRole, UserRole.user_id == User.id)
+                .outerjoin(Role, Role.id == UserRole.role_id)
+                .outerjoin(RolePermission, RolePermission.role_id == Role.id)
+                .outerjoin(Permission, Permission.id == RolePermission.permission_id)
+                .where(User.id == user_id)
+                .group_by(User.id)
+            )
+
+            if not include_deleted:
+                stmt = stmt.where(User.is_deleted == False)
+
+            result = await self.session.execute(stmt)
+            row = result.one_or_none()
+
+        except Exception as e:
+            logger.error("Error fetching user auth context", user_id=user_id, error=str(e))
+            raise DatabaseError(f"Erro ao buscar usuário: {str(e)}")
+
+        if row is None:
+            return None
+
+        return {
+            "id": row.id,
+            "email": row.email,
+            "name": row.name,
+            "is_active": row.is_active,
+            "is_deleted": row.is_deleted,
+            "roles": frozenset(row.roles or ()),
+            "permissions": frozenset(row.permissions or ()),
+        }
+
     async def get_by_email_with_roles(self, email: str, include_deleted: bool = False) -> Optional[User]:
         """Busca usuário por email com roles e permissions carregadas."""
         try:
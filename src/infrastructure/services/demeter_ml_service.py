@@ -1,5 +1,7 @@
 """Serviço de integração com API de ML para classificação de grãos."""
 
+import asyncio
+
 import httpx
 from pathlib import Path
 from decimal import Decimal
@@ -22,6 +24,19 @@ class DemeterMLService:
         self.api_url = settings.DEMETER_ML_API_URL
         self.timeout = settings.DEMETER_ML_TIMEOUT
         self.enable_fallback = settings.ENABLE_ML_FALLBACK_TO_MOCK
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Retorna o cliente HTTP persistente, criando-o no primeiro uso."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP e suas conexões keep-alive."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def classify(self, image_path: str) -> dict:
         """Classifica imagem de grãos usando API de IA."""
@@ -44,42 +59,47 @@ class DemeterMLService:
             raise
 
     async def _read_image(self, image_path: str) -> bytes:
-        """Lê imagem do disco."""
+        """Lê imagem do disco em uma thread, sem bloquear o event loop."""
         try:
             full_path = Path(image_path.lstrip("/"))
-            with open(full_path, "rb") as f:
-                return f.read()
+            return await asyncio.to_thread(self._read_file, full_path)
         except FileNotFoundError:
             raise ValidationError(f"Imagem não encontrada: {image_path}")
 
+    @staticmethod
+    def _read_file(path: Path) -> bytes:
+        """Leitura síncrona do arquivo."""
+        with open(path, "rb") as f:
+            return f.read()
+
     async def _call_api(self, image_data: bytes) -> dict:
         """Chama API de ML."""
         headers = {"Content-Type": "image/jpeg"}
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.api_url,
-                    content=image_data,
-                    headers=headers
-                )
+            client = self._get_client()
+            response = await client.post(
+                self.api_url,
+                content=image_data,
+                headers=headers
+            )
 
-                if response.status_code == 400:
-                    raise ValidationError("Imagem inválida ou formato não suportado")
+            if response.status_code == 400:
+                raise ValidationError("Imagem inválida ou formato não suportado")
 
-                elif response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After", "60")
-                    raise RateLimitError(
-                        f"Limite de requisições excedido. Tente em {retry_after}s"
-                    )
+            elif response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "60")
+                raise RateLimitError(
+                    f"Limite de requisições excedido. Tente em {retry_after}s"
+                )
 
-                elif response.status_code >= 500:
-                    raise ExternalServiceError(
-                        f"Erro no serviço de IA (status {response.status_code})"
-                    )
+            elif response.status_code >= 500:
+                raise ExternalServiceError(
+                    f"Erro no serviço de IA (status {response.status_code})"
+                )
 
-                response.raise_for_status()
-                return response.json()
+            response.raise_for_status()
+            return response.json()
 
         except httpx.ConnectError:
             raise ExternalServiceError("Serviço de IA temporariamente indisponível")
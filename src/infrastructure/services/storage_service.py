@@ -1,5 +1,6 @@
 """Serviço de armazenamento de arquivos."""
 
+import asyncio
 import os
 import secrets
 from pathlib import Path
@@ -17,6 +18,7 @@ class StorageService:
     UPLOAD_DIR = Path("uploads/classifications")
     ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png"}
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    CHUNK_SIZE = 1024 * 1024  # 1MB
 
     def __init__(self):
         self.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -35,9 +37,12 @@ class StorageService:
 
         file_path = user_dir / filename
 
-        content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(content)
+        f = await asyncio.to_thread(open, file_path, "wb")
+        try:
+            while chunk := await file.read(self.CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
 
         relative_path = str(file_path.relative_to("uploads"))
         logger.info("Image saved", user_id=user_id, path=relative_path)
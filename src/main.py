@@ -2,15 +2,20 @@
 Entry point da aplicação DEMETER API.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.config.settings import settings
 from src.config.logging.logger import logger
 from src.config.exceptions.handlers import register_exception_handlers
 from src.config.db.database import database
+from src.config.dependencies.services import close_services
+from src.config.security.password import get_password_hasher
 from src.presentation.api.v1 import router as v1_router
 from src.presentation.api.health import router as health_router
 
@@ -28,10 +33,14 @@ async def lifespan(app: FastAPI):
         environment=settings.ENVIRONMENT,
     )
 
+    # Calibra o Argon2 antes de aceitar requisições, fora do event loop
+    await asyncio.to_thread(get_password_hasher)
+
     yield
 
     logger.info("Shutting down DEMETER API")
 
+    await close_services()
     await database.close()
 
 
@@ -43,6 +52,7 @@ app = FastAPI(
     redoc_url="/redoc" if settings.is_development else None,
     openapi_url="/openapi.json" if settings.is_development else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -59,19 +69,24 @@ app.include_router(health_router)
 app.include_router(v1_router)
 
 
+_ROOT_BYTES = orjson.dumps(
+    {
+        "message": f"Welcome to {settings.PROJECT_NAME}",
+        "version": settings.VERSION,
+        "docs": "/docs" if settings.is_development else "disabled in production",
+        "health": "/health",
+    }
+)
+
+
 @app.get("/", tags=["Root"])
-async def root():
+async def root() -> Response:
     """
     Endpoint raiz da API.
 
     Retorna informações básicas sobre a API.
     """
-    return {
-        "message": f"Welcome to {settings.PROJECT_NAME}",
-        "version": settings.VERSION,
-        "docs": "/docs" if settings.is_development else "disabled in production",
-        "health": "/health",
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
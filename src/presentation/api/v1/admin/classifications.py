@@ -5,17 +5,21 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, status, Query
 
 from src.config.db.dependencies import DbSessionDep
-from src.config.dependencies.common import require_permission
+from src.config.dependencies.common import require_admin, require_permission
+from src.config.dependencies.services import StorageServiceDep
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
 from src.infrastructure.repositories.audit_log_repository_impl import AuditLogRepositoryImpl
 from src.application.schemas.classification import (
     ClassificationResponse,
-    ClassificationListResponse
+    ClassificationListResponse,
+    ClassificationImportRequest,
+    ClassificationImportResponse
 )
 from src.application.schemas.auth import MessageResponse
 from src.application.use_cases.admin.list_all_classifications import ListAllClassificationsUseCase
 from src.application.use_cases.admin.delete_classification import DeleteClassificationAdminUseCase
 from src.application.use_cases.admin.restore_classification import RestoreClassificationUseCase
+from src.application.use_cases.admin.import_classifications import ImportClassificationsUseCase
 
 router = APIRouter()
 
@@ -56,12 +60,13 @@ async def delete_classification(
     classification_id: int,
     current_user: Annotated[dict, Depends(require_permission("classifications:delete:all"))],
     db: DbSessionDep,
+    storage: StorageServiceDep,
     hard: bool = Query(False, description="True=hard delete, False=soft delete")
 ):
     """Deleta classificação (hard ou soft delete)."""
     classification_repo = ClassificationRepositoryImpl(db)
     audit_repo = AuditLogRepositoryImpl(db)
-    use_case = DeleteClassificationAdminUseCase(classification_repo, audit_repo)
+    use_case = DeleteClassificationAdminUseCase(classification_repo, audit_repo, storage)
 
     await use_case.execute(
         classification_id=classification_id,
@@ -92,3 +97,25 @@ async def restore_classification(
         classification_id=classification_id,
         admin_user_id=current_user["id"]
     )
+
+
+@router.post(
+    "/admin/classifications/import",
+    response_model=ClassificationImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="[ADMIN] Importar classificações em massa"
+)
+async def import_classifications(
+    payload: ClassificationImportRequest,
+    current_user: Annotated[dict, Depends(require_admin)],
+    db: DbSessionDep
+):
+    """Importa classificações já processadas (backfill/migração)."""
+    classification_repo = ClassificationRepositoryImpl(db)
+    audit_repo = AuditLogRepositoryImpl(db)
+    use_case = ImportClassificationsUseCase(classification_repo, audit_repo)
+
+    return await use_case.execute(
+        items=payload.items,
+        admin_user_id=current_user["id"]
+    )
@@ -51,7 +51,6 @@ async def register(
     - **name**: Nome completo
     - **phone**: Telefone (10-11 dígitos)
     - **password**: Senha forte (mínimo 8 caracteres, com maiúscula, minúscula, número e especial)
-    - **password_confirm**: Confirmação da senha
     """
     user_repo = UserRepositoryImpl(db)
 
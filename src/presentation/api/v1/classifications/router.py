@@ -6,13 +6,16 @@ from fastapi import APIRouter, Depends, status, File, UploadFile, Form, Query
 
 from src.config.db.dependencies import DbSessionDep
 from src.config.dependencies.common import require_permission
+from src.config.dependencies.services import ClassifierServiceDep, StorageServiceDep
 from src.infrastructure.repositories.classification_repository_impl import ClassificationRepositoryImpl
 from src.application.schemas.classification import (
     ClassificationResponse,
     ClassificationListResponse,
-    ClassificationUpdate
+    ClassificationUpdate,
+    ClassificationBulkResponse
 )
 from src.application.use_cases.classifications.create_classification import CreateClassificationUseCase
+from src.application.use_cases.classifications.bulk_create_classifications import BulkCreateClassificationsUseCase
 from src.application.use_cases.classifications.list_classifications import ListClassificationsUseCase
 from src.application.use_cases.classifications.get_classification import GetClassificationUseCase
 from src.application.use_cases.classifications.update_classification import UpdateClassificationUseCase
@@ -32,11 +35,13 @@ async def create_classification(
     image: Annotated[UploadFile, File(description="Imagem do grão")],
     current_user: Annotated[dict, Depends(require_permission("classifications:create:own"))],
     db: DbSessionDep,
+    storage: StorageServiceDep,
+    classifier: ClassifierServiceDep,
     notes: Annotated[str | None, Form()] = None
 ):
     """Upload de imagem e classificação automática (mock)."""
     repo = ClassificationRepositoryImpl(db)
-    use_case = CreateClassificationUseCase(repo)
+    use_case = CreateClassificationUseCase(repo, storage, classifier)
 
     return await use_case.execute(
         user_id=current_user["id"],
@@ -45,6 +50,31 @@ async def create_classification(
     )
 
 
+@router.post(
+    "/classifications/bulk",
+    response_model=ClassificationBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Criar classificações em lote"
+)
+async def bulk_create_classifications(
+    images: Annotated[list[UploadFile], File(description="Imagens dos grãos")],
+    current_user: Annotated[dict, Depends(require_permission("classifications:create:own"))],
+    db: DbSessionDep,
+    storage: StorageServiceDep,
+    classifier: ClassifierServiceDep,
+    notes: Annotated[str | None, Form()] = None
+):
+    """Upload de várias imagens, classificadas concorrentemente."""
+    repo = ClassificationRepositoryImpl(db)
+    use_case = BulkCreateClassificationsUseCase(CreateClassificationUseCase(repo, storage, classifier))
+
+    return await use_case.execute(
+        user_id=current_user["id"],
+        images=images,
+        notes=notes
+    )
+
+
 @router.get(
     "/classifications",
     response_model=ClassificationListResponse,
@@ -9,9 +9,6 @@ from fastapi import APIRouter, Depends, status
 from src.config.db.dependencies import DbSessionDep
 from src.config.dependencies.common import get_current_user_payload
 from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
-from src.infrastructure.repositories.refresh_token_repository_impl import (
-    RefreshTokenRepositoryImpl,
-)
 from src.application.use_cases.users.get_user import GetUserUseCase
 from src.application.use_cases.users.update_user import UpdateUserUseCase
 from src.application.use_cases.users.delete_user import DeleteUserUseCase
@@ -104,10 +101,9 @@ async def delete_me(
     `Authorization: Bearer <access_token>`
     """
     user_repo = UserRepositoryImpl(db)
-    refresh_token_repo = RefreshTokenRepositoryImpl(db)
     user_id = int(current_user["sub"])
 
-    use_case = DeleteUserUseCase(user_repo, refresh_token_repo)
+    use_case = DeleteUserUseCase(user_repo)
     result = await use_case.execute(user_id)
 
     return MessageResponse(message=result["message"])
@@ -0,0 +1,115 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.models.audit_log import AuditLog
+from src.infrastructure.models.classification import Classification
+from src.infrastructure.models.role import Role
+from src.infrastructure.models.user_role import UserRole
+from src.infrastructure.repositories.classification_repository_impl import _COPY_THRESHOLD
+
+
+async def create_and_login_admin(
+    client: AsyncClient, db_session: AsyncSession, email: str
+) -> tuple[str, int]:
+    register_data = {
+        "name": "Admin User",
+        "email": email,
+        "phone": "11988888888",
+        "password": "Admin123!@#",
+    }
+    await client.post("/api/v1/auth/register", json=register_data)
+
+    login_response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": "Admin123!@#"}
+    )
+    token = login_response.json()["tokens"]["access_token"]
+
+    me_response = await client.get(
+        "/api/v1/users/me", headers={"Authorization": f"Bearer {token}"}
+    )
+    user_id = me_response.json()["id"]
+
+    admin_role_id = await db_session.scalar(select(Role.id).where(Role.name == "admin"))
+    db_session.add(UserRole(user_id=user_id, role_id=admin_role_id))
+    await db_session.flush()
+
+    return token, user_id
+
+
+def import_items(user_id: int, count: int) -> list[dict]:
+    return [
+        {
+            "user_id": user_id,
+            "image_path": f"/uploads/imported/grain_{i}.jpg",
+            "grain_type": "soja",
+            "confidence_score": "0.9",
+            "extra_data": {"source": "backfill", "index": i},
+        }
+        for i in range(count)
+    ]
+
+
+async def count_imported(db_session: AsyncSession) -> tuple[int, int]:
+    classifications = await db_session.scalar(
+        select(func.count()).select_from(Classification)
+    )
+    audits = await db_session.scalar(
+        select(func.count())
+        .select_from(AuditLog)
+        .where(AuditLog.action == "import_classifications")
+    )
+    return classifications, audits
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [_COPY_THRESHOLD, _COPY_THRESHOLD + 1])
+async def test_import_classifications_writes_rows_and_audit(
+    client: AsyncClient, db_session: AsyncSession, count: int
+):
+    token, admin_id = await create_and_login_admin(
+        client, db_session, f"importer{count}@example.com"
+    )
+
+    response = await client.post(
+        "/api/v1/admin/classifications/import",
+        json={"items": import_items(admin_id, count)},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["imported"] == count
+
+    assert await count_imported(db_session) == (count, 1)
+
+    audit = await db_session.scalar(
+        select(AuditLog).where(AuditLog.action == "import_classifications")
+    )
+    assert audit.user_id == admin_id
+    assert audit.changes == {"imported": count}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [_COPY_THRESHOLD, _COPY_THRESHOLD + 1])
+async def test_import_classifications_rolls_back_on_unknown_user(
+    client: AsyncClient, db_session: AsyncSession, count: int
+):
+    token, admin_id = await create_and_login_admin(
+        client, db_session, f"badimporter{count}@example.com"
+    )
+
+    items = import_items(admin_id, count)
+    items[-1]["user_id"] = admin_id + 10_000
+
+    response = await client.post(
+        "/api/v1/admin/classifications/import",
+        json={"items": items},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 422
+    assert "user_id" in response.json()["message"]
+    assert await count_imported(db_session) == (0, 0)
@@ -13,7 +13,6 @@ async def test_register_user_success(client: AsyncClient):
             "email": "testuser@example.com",
             "phone": "11999999999",
             "password": "Test123!@#",
-            "password_confirm": "Test123!@#",
         },
     )
 
@@ -32,7 +31,6 @@ async def test_register_duplicate_email_fails(client: AsyncClient):
         "email": "duplicate@example.com",
         "phone": "11888888888",
         "password": "Test123!@#",
-        "password_confirm": "Test123!@#",
     }
 
     response1 = await client.post("/api/v1/auth/register", json=user_data)
@@ -50,7 +48,6 @@ async def test_login_valid_credentials_success(client: AsyncClient):
         "email": "loginuser@example.com",
         "phone": "11777777777",
         "password": "Login123!@#",
-        "password_confirm": "Login123!@#",
     }
     await client.post("/api/v1/auth/register", json=register_data)
 
@@ -86,7 +83,6 @@ async def test_refresh_token_success(client: AsyncClient):
         "email": "refreshuser@example.com",
         "phone": "11666666666",
         "password": "Refresh123!@#",
-        "password_confirm": "Refresh123!@#",
     }
     await client.post("/api/v1/auth/register", json=register_data)
 
@@ -114,7 +110,6 @@ async def test_logout_revokes_token(client: AsyncClient):
         "email": "logoutuser@example.com",
         "phone": "11555555555",
         "password": "Logout123!@#",
-        "password_confirm": "Logout123!@#",
     }
     await client.post("/api/v1/auth/register", json=register_data)
 
@@ -3,6 +3,8 @@ import io
 import pytest
 from httpx import AsyncClient
 
+from src.config.settings import settings
+
 
 async def create_and_login_user(client: AsyncClient, email: str) -> str:
     register_data = {
@@ -10,7 +12,6 @@ async def create_and_login_user(client: AsyncClient, email: str) -> str:
         "email": email,
         "phone": "11999999999",
         "password": "Test123!@#",
-        "password_confirm": "Test123!@#",
     }
     await client.post("/api/v1/auth/register", json=register_data)
 
@@ -157,3 +158,48 @@ async def test_deleted_not_in_list(client: AsyncClient):
 
     data = list_response.json()
     assert all(item["id"] != classification_id for item in data["items"])
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bulk_create_mixed_batch(client: AsyncClient):
+    token = await create_and_login_user(client, "bulk1@example.com")
+
+    files = [
+        ("images", ("first.jpg", create_fake_image(), "image/jpeg")),
+        ("images", ("notes.txt", create_fake_image(), "text/plain")),
+        ("images", ("second.png", create_fake_image(), "image/png")),
+    ]
+    response = await client.post(
+        "/api/v1/classifications/bulk",
+        files=files,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert [error["filename"] for error in data["errors"]] == ["notes.txt"]
+
+    list_response = await client.get(
+        "/api/v1/classifications", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert list_response.json()["total"] == 2
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_too_many_files(client: AsyncClient):
+    token = await create_and_login_user(client, "bulk2@example.com")
+
+    files = [
+        ("images", (f"grain_{i}.jpg", create_fake_image(), "image/jpeg"))
+        for i in range(settings.MAX_BULK_CLASSIFY_FILES + 1)
+    ]
+    response = await client.post(
+        "/api/v1/classifications/bulk",
+        files=files,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 400
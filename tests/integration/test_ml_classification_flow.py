@@ -11,7 +11,6 @@ async def create_and_login_user(client: AsyncClient, email: str) -> str:
         "email": email,
         "phone": "11988888888",
         "password": "Test123!@#",
-        "password_confirm": "Test123!@#",
     }
     await client.post("/api/v1/auth/register", json=register_data)
 
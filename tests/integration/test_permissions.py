@@ -10,7 +10,6 @@ async def create_and_login_user(client: AsyncClient, email: str) -> str:
         "email": email,
         "phone": "11999999999",
         "password": "Test123!@#",
-        "password_confirm": "Test123!@#",
     }
     await client.post("/api/v1/auth/register", json=register_data)
 
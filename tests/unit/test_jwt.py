@@ -2,12 +2,14 @@ import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from jose.exceptions import ExpiredSignatureError
+from jwt.exceptions import ExpiredSignatureError
 
 from src.config.security.auth import (
     create_access_token,
     extract_user_id_from_token,
+    inspect_token,
     verify_token,
+    verify_token_cached,
 )
 
 
@@ -33,7 +35,7 @@ def test_decode_token_returns_user_id():
 
 @pytest.mark.unit
 def test_decode_expired_token_raises_error():
-    from jose import jwt
+    import jwt
     from src.config.settings import settings
 
     expired_time = datetime.now(timezone.utc) - timedelta(minutes=10)
@@ -49,3 +51,32 @@ def test_decode_expired_token_raises_error():
 
     with pytest.raises(ExpiredSignatureError):
         verify_token(expired_token, token_type="access")
+
+
+@pytest.mark.unit
+def test_verify_token_cached_matches_verify_token():
+    token = create_access_token(subject=789)
+
+    first = verify_token_cached(token)
+    second = verify_token_cached(token)
+
+    assert first == second == verify_token(token)
+
+    with pytest.raises(ValueError):
+        verify_token_cached(token, token_type="refresh")
+
+
+@pytest.mark.unit
+def test_inspect_token_returns_user_id_and_expiration():
+    token = create_access_token(subject=321)
+
+    user_id, expiration, expired = inspect_token(token)
+
+    assert user_id == 321
+    assert expiration > datetime.now(timezone.utc)
+    assert expired is False
+
+
+@pytest.mark.unit
+def test_inspect_token_invalid_token():
+    assert inspect_token("not-a-token") == (None, None, True)
@@ -1,6 +1,12 @@
 import pytest
 
-from src.config.security.password import get_password_hash, verify_password
+from src.config.security.password import (
+    get_password_hash,
+    hash_password_async,
+    validate_password_strength,
+    verify_password,
+    verify_password_async,
+)
 
 
 @pytest.mark.unit
@@ -28,3 +34,139 @@ def test_verify_password_incorrect_returns_false():
     hashed = get_password_hash(password)
 
     assert verify_password(wrong_password, hashed) is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_roundtrip():
+    password = "MySecurePass123!"
+    hashed = await hash_password_async(password)
+
+    assert hashed.startswith("$argon2")
+    assert await verify_password_async(password, hashed) is True
+    assert await verify_password_async("WrongPassword456", hashed) is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "password, expected_valid",
+    [
+        ("MySecurePass123!", True),
+        ("mysecurepass123!", False),
+        ("MYSECUREPASS123!", False),
+        ("MySecurePassword!", False),
+        ("MySecurePass1234", False),
+    ],
+)
+def test_validate_password_strength(password, expected_valid):
+    is_valid, message = validate_password_strength(password)
+
+    assert is_valid is expected_valid
+    assert (message == "") is expected_valid
+
+
+@pytest.fixture
+def fake_argon2(monkeypatch):
+    """
+    Substitui o PasswordHasher por um falso cujo hash "leva" memory_cost ms,
+    registrando os parâmetros de cada tentativa da calibração.
+    """
+    from src.config.security import password
+
+    clock = [0.0]
+    attempts = []
+
+    class FakePasswordHasher:
+        def __init__(self, memory_cost, time_cost, parallelism):
+            self.memory_cost = memory_cost
+            attempts.append((memory_cost, time_cost))
+
+        def hash(self, _password):
+            clock[0] += self.memory_cost / 1000
+
+    monkeypatch.setattr(password, "PasswordHasher", FakePasswordHasher)
+    monkeypatch.setattr(password.time, "perf_counter", lambda: clock[0])
+    return attempts
+
+
+@pytest.mark.unit
+def test_argon2_calibration_never_goes_below_configured_cost(fake_argon2):
+    from src.config.security.password import _calibrate_argon2
+    from src.config.settings import settings
+
+    configured = (settings.ARGON2_MEMORY_COST, settings.ARGON2_TIME_COST)
+
+    assert _calibrate_argon2(0, max_memory_cost=1024) == configured
+    assert fake_argon2 == [configured]
+
+
+@pytest.mark.unit
+def test_argon2_calibration_doubles_memory_until_target(fake_argon2):
+    from src.config.security.password import _calibrate_argon2
+    from src.config.settings import settings
+
+    target_ms = settings.ARGON2_MEMORY_COST * 4
+
+    assert _calibrate_argon2(target_ms, max_memory_cost=1024) == (
+        target_ms,
+        settings.ARGON2_TIME_COST,
+    )
+
+
+@pytest.mark.unit
+def test_argon2_calibration_respects_memory_and_time_caps(fake_argon2):
+    from src.config.security.password import _ARGON2_MAX_TIME_COST, _calibrate_argon2
+    from src.config.settings import settings
+
+    max_memory_cost = settings.ARGON2_MEMORY_COST * 8
+
+    assert _calibrate_argon2(10**9, max_memory_cost=max_memory_cost) == (
+        max_memory_cost,
+        _ARGON2_MAX_TIME_COST,
+    )
+    assert max(memory for memory, _ in fake_argon2) == max_memory_cost
+    at_cap = [time_cost for memory, time_cost in fake_argon2 if memory == max_memory_cost]
+    assert at_cap == list(range(settings.ARGON2_TIME_COST, _ARGON2_MAX_TIME_COST + 1))
+
+
+@pytest.mark.unit
+def test_argon2_memory_cap_splits_available_memory(monkeypatch):
+    from src.config.security import password
+    from src.config.settings import settings
+
+    available = 1024**3
+    monkeypatch.setattr(password, "_available_memory_bytes", lambda: available)
+
+    concurrent = settings.WEB_CONCURRENCY * settings.MAX_CONCURRENT_PASSWORD_HASHES
+    assert password._argon2_memory_cap() == min(
+        password._ARGON2_MAX_MEMORY_COST, available // 2 // 1024 // concurrent
+    )
+
+    monkeypatch.setattr(password, "_available_memory_bytes", lambda: None)
+    assert password._argon2_memory_cap() == password._ARGON2_MAX_MEMORY_COST
+
+
+@pytest.mark.unit
+def test_argon2_calibration_disabled_in_test_environment():
+    from src.config.security.password import _argon2_parameters
+    from src.config.settings import settings
+
+    assert _argon2_parameters() == (
+        settings.ARGON2_MEMORY_COST,
+        settings.ARGON2_TIME_COST,
+    )
+
+
+@pytest.mark.unit
+def test_save_argon2_parameters_replaces_file_atomically(tmp_path, monkeypatch):
+    import json
+
+    from src.config.security import password
+
+    params_file = tmp_path / "nested" / "logs" / "argon2_params.json"
+    monkeypatch.setattr(password, "_ARGON2_PARAMS_FILE", params_file)
+
+    password._save_argon2_parameters({"key": [65536, 2]})
+
+    assert json.loads(params_file.read_text()) == {"key": [65536, 2]}
+    assert list(params_file.parent.iterdir()) == [params_file]
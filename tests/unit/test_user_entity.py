@@ -0,0 +1,48 @@
+import pytest
+
+from src.domain.entities.user import UserEntity
+
+
+@pytest.mark.unit
+def test_user_entity_validates_on_init():
+    with pytest.raises(ValueError):
+        UserEntity(
+            email="invalid-email",
+            name="Maria",
+            hashed_password="hash",
+            phone="11999999999",
+        )
+
+
+@pytest.mark.unit
+def test_from_row_skips_validation_and_fills_defaults():
+    user = UserEntity.from_row(
+        id=1,
+        email="maria@example.com",
+        name="Maria",
+        hashed_password="hash",
+        phone="11999999999",
+    )
+
+    assert user.id == 1
+    assert user.email == "maria@example.com"
+    assert user.is_active is True
+    assert user.last_login is None
+
+
+@pytest.mark.unit
+def test_from_row_requires_mandatory_fields():
+    with pytest.raises(KeyError):
+        UserEntity.from_row(email="maria@example.com")
+
+
+@pytest.mark.unit
+def test_user_entity_has_no_instance_dict():
+    user = UserEntity.from_row(
+        email="maria@example.com",
+        name="Maria",
+        hashed_password="hash",
+        phone="11999999999",
+    )
+
+    assert not hasattr(user, "__dict__")
@@ -0,0 +1,53 @@
+import pytest
+
+from src.infrastructure.cache.user_permissions_cache import (
+    cache_user_permissions,
+    get_cached_user_permissions,
+    invalidate_user_permissions_cache,
+)
+
+
+def _current_user():
+    return {
+        "id": 1,
+        "email": "user@example.com",
+        "name": "User",
+        "roles": frozenset({"user"}),
+        "permissions": frozenset({"classifications:read"}),
+        "is_admin": False,
+    }
+
+
+@pytest.mark.unit
+def test_cached_value_is_isolated_from_callers():
+    invalidate_user_permissions_cache()
+    current_user = _current_user()
+    cache_user_permissions(1, current_user, ttl=60)
+
+    current_user["is_admin"] = True
+    first = get_cached_user_permissions(1)
+    first["is_admin"] = True
+
+    second = get_cached_user_permissions(1)
+    assert second["is_admin"] is False
+    assert second is not first
+
+
+@pytest.mark.unit
+def test_expired_entry_is_dropped():
+    invalidate_user_permissions_cache()
+    cache_user_permissions(1, _current_user(), ttl=0)
+
+    assert get_cached_user_permissions(1) is None
+
+
+@pytest.mark.unit
+def test_invalidate_removes_user():
+    invalidate_user_permissions_cache()
+    cache_user_permissions(1, _current_user(), ttl=60)
+    cache_user_permissions(2, _current_user(), ttl=60)
+
+    invalidate_user_permissions_cache(1)
+
+    assert get_cached_user_permissions(1) is None
+    assert get_cached_user_permissions(2) is not None